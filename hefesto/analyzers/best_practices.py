@@ -23,6 +23,9 @@ from hefesto.core.ast.generic_ast import GenericAST
 class BestPracticesAnalyzer:
     """Analyzes code for best practice violations."""
 
+    # Highest severity this analyzer emits; the engine skips it above this threshold.
+    max_severity = AnalysisIssueSeverity.MEDIUM
+
     # Common single-letter names that are acceptable in specific contexts
     ACCEPTABLE_SINGLE_LETTERS = {"i", "j", "k", "x", "y", "z", "n", "e", "f"}
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Protocol, Tuple
 
 try:
     import boto3
@@ -10,6 +11,9 @@ except Exception:  # pragma: no cover
     boto3 = None
     ClientError = Exception  # type: ignore
 
+# EC2 accepts at most this many values in a single describe filter.
+_MAX_FILTER_VALUES = 200
+
 
 @dataclass(frozen=True)
 class ResolveResult:
@@ -21,6 +25,39 @@ class ResolverStrategy(Protocol):
     def resolve(self, template: Dict[str, Any], region: str, session: Any) -> ResolveResult: ...
 
 
+class ResolverCache:
+    """
+    TTL cache of strategy results, shared across ResourceResolver.resolve calls.
+
+    Strategies that define ``cache_key(template)`` are cached under
+    (strategy, region, key), so templates that point at the same stack, tags
+    or group names reuse one set of AWS calls. Empty results are not stored,
+    so throttled or failed lookups are retried.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Hashable, Tuple[float, ResolveResult]] = {}
+
+    def get(self, key: Hashable) -> Optional[ResolveResult]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return entry[1]
+        self._entries.pop(key, None)
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, result: ResolveResult) -> None:
+        if result.resource_map:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class AwsSessionFactory:
     @staticmethod
     def get_session(region: str, credentials: Any) -> Optional[Any]:
@@ -68,6 +105,9 @@ class StackResolver:
         except Exception as e:
             return ResolveResult(resource_map={}, evidence=[f"StackResolver: error {e}"])
 
+    def cache_key(self, template: Dict[str, Any]) -> Hashable:
+        return self._get_stack_name(template)
+
     def _get_stack_name(self, template: Dict[str, Any]) -> Optional[str]:
         if self.explicit_stack_name:
             return self.explicit_stack_name
@@ -108,18 +148,7 @@ class TagResolver:
                 resource_map={}, evidence=[f"TagResolver: cannot create tagging client: {e}"]
             )
 
-        tag_filters = {}
-        if self.explicit_tags:
-            tag_filters = self.explicit_tags
-        else:
-            # Look for any tag hints provided by user in Metadata.HefestoTagFilters (dict)
-            md = template.get("Metadata") or {}
-            if isinstance(md, dict):
-                raw = md.get("HefestoTagFilters")
-                if isinstance(raw, dict):
-                    tag_filters = {
-                        str(k): str(v) for k, v in raw.items() if isinstance(v, (str, int, float))
-                    }
+        tag_filters = self._get_tag_filters(template)
 
         if not tag_filters:
             return ResolveResult(
@@ -159,6 +188,20 @@ class TagResolver:
         except Exception as e:
             return ResolveResult(resource_map={}, evidence=[f"TagResolver: error {e}"])
 
+    def cache_key(self, template: Dict[str, Any]) -> Hashable:
+        return tuple(sorted(self._get_tag_filters(template).items()))
+
+    def _get_tag_filters(self, template: Dict[str, Any]) -> Dict[str, str]:
+        if self.explicit_tags:
+            return self.explicit_tags
+        # Look for any tag hints provided by user in Metadata.HefestoTagFilters (dict)
+        md = template.get("Metadata") or {}
+        if isinstance(md, dict):
+            raw = md.get("HefestoTagFilters")
+            if isinstance(raw, dict):
+                return {str(k): str(v) for k, v in raw.items() if isinstance(v, (str, int, float))}
+        return {}
+
 
 class NameResolver:
     """
@@ -168,19 +211,7 @@ class NameResolver:
     """
 
     def resolve(self, template: Dict[str, Any], region: str, session: Any) -> ResolveResult:
-        resources = template.get("Resources", {}) or {}
-        sg_candidates: List[Tuple[str, str]] = []  # (logical_id, desired_group_name)
-
-        for logical_id, res in resources.items():
-            if (res or {}).get("Type") != "AWS::EC2::SecurityGroup":
-                continue
-            props = (res or {}).get("Properties", {}) or {}
-            group_name = props.get("GroupName")
-            if isinstance(group_name, str) and group_name.strip():
-                sg_candidates.append((str(logical_id), group_name.strip()))
-            else:
-                # last resort: logical_id itself
-                sg_candidates.append((str(logical_id), str(logical_id)))
+        sg_candidates = self._sg_candidates(template)
 
         if not sg_candidates:
             return ResolveResult(
@@ -194,26 +225,56 @@ class NameResolver:
                 resource_map={}, evidence=[f"NameResolver: cannot create ec2 client: {e}"]
             )
 
-        mapping: Dict[str, str] = {}
-        evidence: List[str] = []
-        for logical_id, group_name in sg_candidates:
+        # One filtered describe per batch of names, not one call per candidate.
+        names = list(dict.fromkeys(name for _, name in sg_candidates))
+        group_ids: Dict[str, List[str]] = {}
+        for start in range(0, len(names), _MAX_FILTER_VALUES):
+            batch = names[start : start + _MAX_FILTER_VALUES]
             try:
-                resp = ec2.describe_security_groups(
-                    Filters=[{"Name": "group-name", "Values": [group_name]}]
+                pages = ec2.get_paginator("describe_security_groups").paginate(
+                    Filters=[{"Name": "group-name", "Values": batch}]
                 )
-                sgs = resp.get("SecurityGroups", [])
-                if len(sgs) == 1 and sgs[0].get("GroupId"):
-                    mapping[logical_id] = str(sgs[0]["GroupId"])
+                for page in pages:
+                    for sg in page.get("SecurityGroups", []):
+                        if sg.get("GroupName") and sg.get("GroupId"):
+                            group_ids.setdefault(sg["GroupName"], []).append(str(sg["GroupId"]))
             except ClientError:
                 continue
             except Exception:
                 continue
 
+        mapping: Dict[str, str] = {}
+        evidence: List[str] = []
+        for logical_id, group_name in sg_candidates:
+            ids = group_ids.get(group_name, [])
+            if len(ids) == 1:
+                mapping[logical_id] = ids[0]
+
         evidence.append(
             f"NameResolver: matched {len(mapping)}/{len(sg_candidates)} SGs by group-name heuristic"
         )
         return ResolveResult(resource_map=mapping, evidence=evidence)
 
+    def cache_key(self, template: Dict[str, Any]) -> Hashable:
+        return tuple(self._sg_candidates(template))
+
+    def _sg_candidates(self, template: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """(logical_id, desired_group_name) for each security group in the template."""
+        resources = template.get("Resources", {}) or {}
+        sg_candidates: List[Tuple[str, str]] = []
+
+        for logical_id, res in resources.items():
+            if (res or {}).get("Type") != "AWS::EC2::SecurityGroup":
+                continue
+            props = (res or {}).get("Properties", {}) or {}
+            group_name = props.get("GroupName")
+            if isinstance(group_name, str) and group_name.strip():
+                sg_candidates.append((str(logical_id), group_name.strip()))
+            else:
+                # last resort: logical_id itself
+                sg_candidates.append((str(logical_id), str(logical_id)))
+        return sg_candidates
+
 
 class ResourceResolver:
     """
@@ -221,8 +282,13 @@ class ResourceResolver:
     earlier strategies win; later strategies only fill gaps.
     """
 
-    def __init__(self, strategies: Optional[List[ResolverStrategy]] = None):
+    def __init__(
+        self,
+        strategies: Optional[List[ResolverStrategy]] = None,
+        cache: Optional[ResolverCache] = None,
+    ):
         self.strategies = strategies or [StackResolver(), TagResolver(), NameResolver()]
+        self.cache = cache
 
     def resolve(self, template: Dict[str, Any], region: str, credentials: Any) -> ResolveResult:
         session = AwsSessionFactory.get_session(region=region, credentials=credentials)
@@ -235,7 +301,7 @@ class ResourceResolver:
         evidence: List[str] = []
 
         for strat in self.strategies:
-            res = strat.resolve(template=template, region=region, session=session)
+            res = self._resolve_one(strat, template, region, session)
             evidence.extend(res.evidence)
 
             # fill gaps only
@@ -245,3 +311,17 @@ class ResourceResolver:
 
         evidence.append(f"ResourceResolver: final resolved {len(merged)} logical IDs")
         return ResolveResult(resource_map=merged, evidence=evidence)
+
+    def _resolve_one(
+        self, strat: ResolverStrategy, template: Dict[str, Any], region: str, session: Any
+    ) -> ResolveResult:
+        cache_key = getattr(strat, "cache_key", None)
+        if self.cache is None or cache_key is None:
+            return strat.resolve(template=template, region=region, session=session)
+
+        key = (type(strat).__name__, region, cache_key(template))
+        res = self.cache.get(key)
+        if res is None:
+            res = strat.resolve(template=template, region=region, session=session)
+            self.cache.put(key, res)
+        return res
@@ -34,6 +34,9 @@ GOD_CLASS_THRESHOLD = 500
 class CodeSmellAnalyzer:
     """Analyzes code for common code smells."""
 
+    # Highest severity this analyzer emits; the engine skips it above this threshold.
+    max_severity = AnalysisIssueSeverity.HIGH
+
     def analyze(self, tree: GenericAST, file_path: str, code: str) -> List[AnalysisIssue]:
         """Analyze code for code smells."""
         issues = []
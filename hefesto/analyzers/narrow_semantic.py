@@ -38,6 +38,9 @@ class NarrowSemanticAnalyzer:
     ``engine.register_analyzer(NarrowSemanticAnalyzer())``.
     """
 
+    # Highest severity this analyzer emits; the engine skips it above this threshold.
+    max_severity = AnalysisIssueSeverity.MEDIUM
+
     def analyze(self, tree: GenericAST, file_path: str, code: str) -> List[AnalysisIssue]:
         if tree.language != "python" or not code:
             return []
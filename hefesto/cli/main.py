@@ -7,16 +7,36 @@ Provides commands for running Hefesto API server and analyzing code.
 Copyright © 2025 Narapa LLC, Miami, Florida
 """
 
+import os
+import stat
 import sys
+from collections import defaultdict
+from pathlib import Path
 from typing import Optional, Tuple
 
 import click
 
 from hefesto.__version__ import __version__
-from hefesto.telemetry.client import TelemetryClient
 
-# Initialize telemetry
-telemetry = TelemetryClient()
+_telemetry_client = None
+
+
+def _telemetry():
+    """Return the process-wide TelemetryClient, importing it on first use."""
+    global _telemetry_client
+    if _telemetry_client is None:
+        from hefesto.telemetry.client import TelemetryClient
+
+        _telemetry_client = TelemetryClient()
+    return _telemetry_client
+
+
+def __getattr__(name: str):
+    # Keep ``hefesto.cli.main.telemetry`` importable without constructing the
+    # client at module import time.
+    if name == "telemetry":
+        return _telemetry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _detect_command(argv: list[str]) -> str:
@@ -30,58 +50,46 @@ def _detect_command(argv: list[str]) -> str:
     """
     tokens = argv[1:]  # skip program name
 
-    # Pre-checks for help/version which might not be caught by generic logic
-    if any(a in ("-h", "--help") for a in tokens):
-        return "help"
-    if any(a == "--version" for a in tokens):
+    # One pass: help anywhere wins, then --version, then the first known
+    # command (plus its first positional, for telemetry subcommands).
+    version_seen = False
+    cmd = None
+    sub = None
+    for t in tokens:
+        if t in ("-h", "--help"):
+            return "help"
+        if t == "--version":
+            version_seen = True
+        elif cmd is None:
+            if t in _KNOWN_CMDS:
+                cmd = t
+        elif cmd == "telemetry" and sub is None and not t.startswith("-"):
+            sub = t
+
+    if version_seen:
         return "version"
-
-    cmd_parts = _parse_command_parts(tokens)
-
-    if not cmd_parts:
+    if cmd is None:
         return "unknown"
-    return " ".join(cmd_parts)
-
-
-def _parse_command_parts(tokens: list[str]) -> list[str]:
-    cmd_parts: list[str] = []
-    i = 0
-    while i < len(tokens):
-        t = tokens[i]
-
-        if t.startswith("-"):
-            if "=" not in t and (i + 1) < len(tokens) and not tokens[i + 1].startswith("-"):
-                i += 2
-            else:
-                i += 1
-            continue
-
-        cmd_parts.append(t)
-        i += 1
-
-        if t == "telemetry":
-            i = _parse_telemetry_subcommand(tokens, i, cmd_parts)
-            break
-
-        break
-    return cmd_parts
+    return f"telemetry {sub}" if sub else cmd
 
 
-def _parse_telemetry_subcommand(tokens: list[str], i: int, cmd_parts: list[str]) -> int:
-    while i < len(tokens) and tokens[i].startswith("-"):
-        if "=" not in tokens[i] and (i + 1) < len(tokens) and not tokens[i + 1].startswith("-"):
-            i += 2
-        else:
-            i += 1
-    if i < len(tokens) and not tokens[i].startswith("-"):
-        cmd_parts.append(tokens[i])
-    return i
+# Severity name -> rank, shared by the analyze and drift exit-code gates.
+_SEV_RANK = {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
 
 
 def _exit(code: int) -> None:
     raise SystemExit(code)
 
 
+def _pro_required() -> None:
+    """Report that the command needs the PRO/OMEGA distribution and exit 1."""
+    click.echo(
+        "This feature requires Hefesto PRO/OMEGA. Install from the private distribution.",
+        err=True,
+    )
+    _exit(1)
+
+
 @click.group()
 @click.version_option(version=__version__)
 def cli():
@@ -109,11 +117,7 @@ def serve(host: Optional[str], port: Optional[int], reload: bool):
     from hefesto.pro_optional import HAS_API_HARDENING
 
     if not HAS_API_HARDENING:
-        click.echo(
-            "This feature requires Hefesto PRO/OMEGA. " "Install from the private distribution.",
-            err=True,
-        )
-        _exit(1)
+        _pro_required()
 
     try:
         from hefesto.server import create_app
@@ -186,6 +190,12 @@ def serve(host: Optional[str], port: Optional[int], reload: bool):
     default=None,
     help="Maximum number of issues to display (default: all)",
 )
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Analyze files in N worker processes (default: 1)",
+)
 @click.option(
     "--exclude-types",
     default="",
@@ -228,6 +238,7 @@ def analyze(
     fail_on: Optional[str],
     quiet: bool,
     max_issues: Optional[int],
+    jobs: int,
     exclude_types: str,
     enable_memory_budget_gate: bool,
     include_third_party: bool,
@@ -258,10 +269,13 @@ def analyze(
     json_mode = output == "json"
 
     paths_list = list(paths)
-    _echo_analysis_config(paths_list, severity, exclude, quiet, json_mode)
+    exclude_list = [p.strip() for p in exclude.split(",") if p.strip()]
+    _echo_analysis_config(paths_list, severity, exclude_list, quiet, json_mode)
+
+    # Compile exclude patterns (plus defaults) once for all paths
+    from hefesto.core.analyzer_engine import compile_excludes
 
-    # Parse exclude patterns
-    exclude_patterns = [p.strip() for p in exclude.split(",") if p.strip()]
+    exclude_patterns = compile_excludes(exclude_list)
 
     # Build scope gating config (PRO EPIC 1)
     scope_config = _build_scope_config(
@@ -282,7 +296,9 @@ def analyze(
     )
 
     try:
-        engine = _setup_analyzer_engine(severity, quiet, json_mode, scope_config, enrich_config)
+        engine = _setup_analyzer_engine(
+            severity, quiet, json_mode, scope_config, enrich_config, jobs=jobs
+        )
         if not engine:
             _exit(1)
 
@@ -304,7 +320,7 @@ def analyze(
 
         _run_ml_analysis(all_file_results, source_cache, quiet, json_mode)
 
-        meta = engine._build_meta() if hasattr(engine, "_build_meta") else {}
+        meta = engine._build_meta()
         if budget_result is not None:
             meta["dynamic_budget_results"] = budget_result.to_dict()
 
@@ -322,17 +338,18 @@ def analyze(
         exit_code = _determine_exit_code(combined_report, fail_on, exclude_types, quiet, json_mode)
 
         # Anonymous usage ping — also caches latest_version for upgrade notice
-        from hefesto.telemetry.client import _ping_remote, get_upgrade_notice
+        from hefesto.telemetry.client import _ping_remote_detached, get_upgrade_notice
 
-        _ping_remote(
+        summary = combined_report.summary
+        _ping_remote_detached(
             {
                 "event": "analyze",
                 "v": __version__,
                 "os": sys.platform,
                 "py": f"{sys.version_info.major}.{sys.version_info.minor}",
-                "files": combined_report.summary.files_analyzed,
-                "duration_ms": int(combined_report.summary.duration_seconds * 1000),
-                "issues": combined_report.summary.total_issues,
+                "files": summary.files_analyzed,
+                "duration_ms": int(summary.duration_seconds * 1000),
+                "issues": summary.total_issues,
                 "exit_code": exit_code,
             }
         )
@@ -349,45 +366,43 @@ def analyze(
         _exit(1)
 
 
-def _echo_analysis_config(paths_list, severity, exclude, quiet, json_mode=False):
+def _echo_analysis_config(paths_list, severity, exclude_list, quiet, json_mode=False):
     use_stderr = json_mode
     if not quiet:
         click.echo(f"Analyzing: {', '.join(paths_list)}", err=use_stderr)
         click.echo(f"Minimum severity: {severity.upper()}", err=use_stderr)
 
-    exclude_patterns = [p.strip() for p in exclude.split(",") if p.strip()]
-    if exclude_patterns and not quiet:
-        click.echo(f"Excluding: {', '.join(exclude_patterns)}", err=use_stderr)
+    if exclude_list and not quiet:
+        click.echo(f"Excluding: {', '.join(exclude_list)}", err=use_stderr)
 
 
 @cli.command()
 def info():
     """Show Hefesto configuration and license info."""
-    click.echo(
-        "This feature requires Hefesto PRO/OMEGA. " "Install from the private distribution.",
-        err=True,
-    )
-    _exit(1)
+    _pro_required()
 
 
 @cli.command()
 def check():
     """Check Hefesto installation and dependencies."""
-    import importlib.util
-
-    click.echo("Checking Hefesto installation...")
-    click.echo("")
+    from importlib.metadata import distributions
 
-    # Check Python version
+    # Python version is checked up front so the error can go to stderr;
+    # everything else is assembled and emitted in one write.
     py_version = sys.version_info
-    click.echo(f"Python: {py_version.major}.{py_version.minor}.{py_version.micro}")
     if py_version < (3, 10):
         click.echo("   [ERROR] Python 3.10+ required", err=True)
-    else:
-        click.echo("   [OK] Version OK")
 
-    click.echo("")
-    click.echo("Core Dependencies:")
+    lines = [
+        "Checking Hefesto installation...",
+        "",
+        f"Python: {py_version.major}.{py_version.minor}.{py_version.micro}",
+    ]
+    if py_version >= (3, 10):
+        lines.append("   [OK] Version OK")
+
+    lines.append("")
+    lines.append("Core Dependencies:")
 
     deps = {
         "click": "Click (CLI framework)",
@@ -399,15 +414,17 @@ def check():
         "jinja2": "Jinja2 (report templates)",
     }
 
-    for module_name, description in deps.items():
-        spec = importlib.util.find_spec(module_name)
-        if spec:
-            click.echo(f"   [OK] {description}")
-        else:
-            click.echo(f"   [MISSING] {description}")
+    # Keys are distribution names. importlib.metadata lists each sys.path entry
+    # once and caches it, so every presence check after the first is an
+    # in-memory name match; METADATA is never parsed and, unlike find_spec,
+    # no parent package of a namespace module is imported.
+    for dist_name, description in deps.items():
+        ok = next(iter(distributions(name=dist_name)), None) is not None
+        lines.append(f"   [{'OK' if ok else 'MISSING'}] {description}")
 
-    click.echo("")
-    click.echo("Installation check complete!")
+    lines.append("")
+    lines.append("Installation check complete!")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -419,11 +436,7 @@ def activate(license_key: str):
     Usage:
         hefesto activate HFST-XXXX-XXXX-XXXX-XXXX-XXXX
     """
-    click.echo(
-        "This feature requires Hefesto PRO/OMEGA. " "Install from the private distribution.",
-        err=True,
-    )
-    _exit(1)
+    _pro_required()
 
 
 @cli.command()
@@ -433,11 +446,7 @@ def deactivate():
 
     This will remove your license key and revert to free tier.
     """
-    click.echo(
-        "This feature requires Hefesto PRO/OMEGA. " "Install from the private distribution.",
-        err=True,
-    )
-    _exit(1)
+    _pro_required()
 
 
 @cli.command()
@@ -445,11 +454,7 @@ def status():
     """
     Show current license status and tier information.
     """
-    click.echo(
-        "This feature requires Hefesto PRO/OMEGA. " "Install from the private distribution.",
-        err=True,
-    )
-    _exit(1)
+    _pro_required()
 
 
 @cli.command()
@@ -469,8 +474,6 @@ def check_ci_parity(project_root: str):
         hefesto check-ci-parity
         hefesto check-ci-parity --project-root /path/to/project
     """
-    from pathlib import Path
-
     from hefesto.validators.ci_parity import CIParityChecker
 
     click.echo("Checking CI parity...")
@@ -567,7 +570,6 @@ def pr_review(project_root, base, head, strict, post, repo, pr):
         hefesto pr-review --post --pr 42 --repo owner/name # convenience post
     """
     import json
-    from pathlib import Path
 
     from hefesto.pr_review.orchestrator import run_pr_review
 
@@ -642,8 +644,13 @@ def install_hooks(force: bool):
     if not repo_root:
         _exit(1)
 
+    git_dir = _resolve_git_dir(repo_root)
+    if git_dir is None:
+        click.echo(f"Error: could not resolve git directory for {repo_root}", err=True)
+        _exit(1)
+
     for hook_name in ("pre-commit", "pre-push"):
-        _install_hook(repo_root, hook_name, force)
+        _install_hook(repo_root, git_dir, hook_name, force)
 
 
 @cli.group()
@@ -655,14 +662,20 @@ def telemetry_cmd():
 @telemetry_cmd.command("status")
 def telemetry_status():
     """Show telemetry config and local file status."""
-    s = telemetry.get_status()
-    click.echo("Telemetry Status:")
-    click.echo(f"  Enabled:   {bool(s.get('enabled'))}")
-    click.echo(f"  Path:      {s.get('path')}")
-    click.echo(f"  Size:      {s.get('size_bytes')} bytes")
-    click.echo(f"  Max Bytes: {s.get('max_bytes')}")
-    click.echo(f"  Max Files: {s.get('max_files')}")
-    click.echo(f"  Schema:    v{s.get('schema_version')}")
+    s = _telemetry().get_status()
+    click.echo(
+        "\n".join(
+            [
+                "Telemetry Status:",
+                f"  Enabled:   {bool(s.get('enabled'))}",
+                f"  Path:      {s.get('path')}",
+                f"  Size:      {s.get('size_bytes')} bytes",
+                f"  Max Bytes: {s.get('max_bytes')}",
+                f"  Max Files: {s.get('max_files')}",
+                f"  Schema:    v{s.get('schema_version')}",
+            ]
+        )
+    )
 
 
 @telemetry_cmd.command("clear")
@@ -677,7 +690,7 @@ def telemetry_clear(yes: bool):
         if not ok:
             click.echo("Cancelled.")
             return
-    telemetry.clear_data()
+    _telemetry().clear_data()
     click.echo("Telemetry data cleared.")
 
 
@@ -688,6 +701,7 @@ cli.add_command(telemetry_cmd, name="telemetry")
 def main() -> None:
     # Start telemetry if valid command
     cmd = _detect_command(list(sys.argv))
+    telemetry = _telemetry()
     telemetry.start(command=cmd, version=__version__, argv=list(sys.argv))
 
     try:
@@ -710,58 +724,97 @@ def main() -> None:
 
 
 def _find_repo_root():
-    import subprocess
-    from pathlib import Path
-
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True
-        )
-        return Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        current = Path.cwd()
-        for parent in [current] + list(current.parents):
-            if (parent / ".git").exists():
-                return parent
+    # Walk up looking for ``.git`` (a directory, or a pointer file in
+    # worktrees/submodules) instead of spawning ``git rev-parse``.
+    current = Path.cwd()
+    for parent in (current, *current.parents):
+        if (parent / ".git").exists():
+            return parent
 
     click.echo("Error: Not a git repository!", err=True)
     click.echo("   Run this command from within a git repository.")
     return None
 
 
-def _install_hook(repo_root, hook_name, force):
-    import os
-    import shutil
-    import stat
+def _resolve_git_dir(repo_root):
+    """Return the git directory whose ``hooks/`` applies to ``repo_root``.
+
+    ``.git`` is a directory in a regular checkout but a ``gitdir: <path>``
+    pointer file in worktrees and submodules. Worktrees additionally share
+    hooks through the ``commondir`` of the main repository.
+    """
+    git_path = repo_root / ".git"
+    try:
+        st = os.stat(git_path)
+    except OSError:
+        return None
+    if stat.S_ISDIR(st.st_mode):
+        return git_path
+
+    try:
+        with open(git_path, "r", encoding="utf-8") as f:
+            pointer = f.readline().strip()
+    except OSError:
+        return None
+    if not pointer.startswith("gitdir:"):
+        return None
 
-    git_dir = repo_root / ".git"
+    git_dir = Path(pointer[len("gitdir:") :].strip())
+    if not git_dir.is_absolute():
+        git_dir = repo_root / git_dir
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    return git_dir / common
+
+
+def _install_hook(repo_root, git_dir, hook_name, force):
     source_hook = repo_root / "scripts" / "git-hooks" / hook_name
 
-    if not source_hook.exists():
+    # Read the template once; a missing file is reported by the read itself
+    # rather than a separate exists() probe.
+    try:
+        data = source_hook.read_bytes()
+    except FileNotFoundError:
         click.echo(f"Skipping {hook_name}: template not found at {source_hook}", err=True)
         return
+    except OSError as e:
+        click.echo(f"Error installing {hook_name}: {e}", err=True)
+        _exit(1)
 
     hooks_dir = git_dir / "hooks"
     hooks_dir.mkdir(exist_ok=True)
     dest_hook = hooks_dir / hook_name
 
-    if dest_hook.exists() and not force:
+    try:
+        dest_size = dest_hook.stat().st_size
+    except OSError:
+        dest_size = None
+
+    if dest_size is not None and not force:
+        # The template is already in memory: a size mismatch settles it from
+        # the stat alone, otherwise a bytes compare needs one read of the hook.
         try:
-            with open(source_hook, "r") as src, open(dest_hook, "r") as dst:
-                if src.read() == dst.read():
-                    click.echo(f"{hook_name}: already up to date.")
-                    return
+            if dest_size == len(data) and dest_hook.read_bytes() == data:
+                click.echo(f"{hook_name}: already up to date.")
+                return
         except Exception:
             pass
         click.echo(f"{hook_name}: already exists at {dest_hook}. Use --force to overwrite.")
         return
 
+    # Write to a sibling temp file created executable, then rename over the
+    # destination so an interrupted install never leaves a half-written hook.
+    tmp_hook = dest_hook.with_suffix(".tmp")
     try:
-        shutil.copy2(source_hook, dest_hook)
-        st = os.stat(dest_hook)
-        os.chmod(dest_hook, st.st_mode | stat.S_IEXEC)
+        fd = os.open(tmp_hook, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_hook, dest_hook)
         click.echo(f"{hook_name}: installed to {dest_hook}")
     except Exception as e:
+        tmp_hook.unlink(missing_ok=True)
         click.echo(f"Error installing {hook_name}: {e}", err=True)
         _exit(1)
 
@@ -773,8 +826,6 @@ def _mount_iris_ingest(app):
     Store selection: BigQueryStore when IRIS_BQ_PROJECT is set, else InMemoryStore.
     """
     try:
-        import os
-
         from iris.core.ingest import create_ingest_router
 
         if os.environ.get("IRIS_BQ_PROJECT"):
@@ -797,7 +848,9 @@ def _mount_iris_ingest(app):
         pass  # IRIS not installed — skip silently
 
 
-def _setup_analyzer_engine(severity, quiet, json_mode=False, scope_config=None, enrich_config=None):
+def _setup_analyzer_engine(
+    severity, quiet, json_mode=False, scope_config=None, enrich_config=None, jobs=1
+):
     from hefesto.analyzers import (
         BestPracticesAnalyzer,
         CodeSmellAnalyzer,
@@ -822,6 +875,10 @@ def _setup_analyzer_engine(severity, quiet, json_mode=False, scope_config=None,
             scope_config=scope_config,
             enrich_config=enrich_config,
             quiet=quiet,
+            jobs=jobs,
+            # Sources are only needed by the ML duplicate pass; don't pin every
+            # file in memory for tiers that never run it.
+            cache_sources=_ml_tier_enabled(),
         )
 
         # Register all analyzers
@@ -873,16 +930,17 @@ def _run_analysis_loop(engine, paths_list, exclude_patterns):
         total_loc += report.summary.total_loc
         total_duration += report.summary.duration_seconds
 
-    source_cache = getattr(engine, "source_cache", {})
-    return all_file_results, total_loc, total_duration, source_cache
+    return all_file_results, total_loc, total_duration, engine.source_cache
+
+
+def _ml_tier_enabled():
+    """Return True when HEFESTO_TIER unlocks ML semantic analysis."""
+    return os.environ.get("HEFESTO_TIER", "") in ("professional", "omega")
 
 
 def _run_ml_analysis(all_file_results, source_cache, quiet, json_mode):
     """Run ML-powered semantic duplication analysis (OMEGA/PRO only)."""
-    import os
-
-    tier = os.environ.get("HEFESTO_TIER", "")
-    if tier not in ("professional", "omega"):
+    if not _ml_tier_enabled():
         return
     try:
         from hefesto.analyzers.semantic_duplication import find_semantic_duplicates
@@ -893,11 +951,16 @@ def _run_ml_analysis(all_file_results, source_cache, quiet, json_mode):
             click.echo("Running ML semantic analysis...", err=json_mode)
         ml_issues, stats = find_semantic_duplicates(all_file_results, source_cache)
         if ml_issues:
-            file_map = {fr.file_path: fr for fr in all_file_results}
+            # Bucket issues per file, then extend each FileResult once. Walking
+            # in reverse and popping keeps the previous behavior of attaching
+            # to the last result when a file was analyzed under two paths.
+            buckets = defaultdict(list)
             for issue in ml_issues:
-                fr = file_map.get(issue.file_path)
-                if fr:
-                    fr.issues.append(issue)
+                buckets[issue.file_path].append(issue)
+            for fr in reversed(all_file_results):
+                bucket = buckets.pop(fr.file_path, None)
+                if bucket:
+                    fr.issues.extend(bucket)
             if not quiet and not json_mode:
                 import click
 
@@ -920,19 +983,20 @@ def _run_ml_analysis(all_file_results, source_cache, quiet, json_mode):
 def _generate_report(all_file_results, total_loc, total_duration, output, save_html, meta=None):
     from hefesto.core.analysis_models import AnalysisReport, AnalysisSummary
 
-    # Get all issues from combined file results
-    all_issues = []
+    # Count issues by severity in a single pass over the combined file results
+    counts = dict.fromkeys(_SEV_RANK, 0)
     for file_result in all_file_results:
-        all_issues.extend(file_result.issues)
+        for issue in file_result.issues:
+            counts[issue.severity.value] += 1
 
     # Create combined report
     combined_summary = AnalysisSummary(
         files_analyzed=len(all_file_results),
-        total_issues=len(all_issues),
-        critical_issues=sum(1 for i in all_issues if i.severity.value == "CRITICAL"),
-        high_issues=sum(1 for i in all_issues if i.severity.value == "HIGH"),
-        medium_issues=sum(1 for i in all_issues if i.severity.value == "MEDIUM"),
-        low_issues=sum(1 for i in all_issues if i.severity.value == "LOW"),
+        total_issues=sum(counts.values()),
+        critical_issues=counts["CRITICAL"],
+        high_issues=counts["HIGH"],
+        medium_issues=counts["MEDIUM"],
+        low_issues=counts["LOW"],
         total_loc=total_loc,
         duration_seconds=total_duration,
     )
@@ -952,34 +1016,29 @@ def _print_report(combined_report, output, save_html, quiet, max_issues):
 
     json_mode = output == "json"
 
-    # Apply max_issues limit if specified (affects display only)
-    display_issues = combined_report.get_all_issues()
-    if max_issues and len(display_issues) > max_issues:
-        if not quiet:
-            click.echo(
-                f"(Showing first {max_issues} of {len(display_issues)} issues)",
-                err=json_mode,
-            )
+    # Apply max_issues limit if specified (affects display only). Issues are
+    # already severity-filtered by the engine, so the summary count is exact
+    # and there is no need to flatten every file's issue list here.
+    total_issues = combined_report.summary.total_issues
+    if max_issues and total_issues > max_issues and not quiet:
+        click.echo(
+            f"(Showing first {max_issues} of {total_issues} issues)",
+            err=json_mode,
+        )
 
-    # Generate output
-    if output == "text":
-        reporter = TextReporter()
-        result = reporter.generate(combined_report)
-        click.echo(result)
-    elif output == "json":
-        reporter = JSONReporter()
-        result = reporter.generate(combined_report)
-        click.echo(result)
-    elif output == "html":
-        reporter = HTMLReporter()
-        result = reporter.generate(combined_report)
-
-        if save_html:
-            with open(save_html, "w", encoding="utf-8") as f:
-                f.write(result)
-            click.echo(f"HTML report saved to: {save_html}")
-        else:
-            click.echo(result)
+    # Generate output (click.Choice guarantees ``output`` is a known key)
+    reporters = {"text": TextReporter, "json": JSONReporter, "html": HTMLReporter}
+    reporter = reporters[output]()
+
+    if output == "html" and save_html:
+        # Stream straight to disk so the full document is never held in memory.
+        with open(save_html, "w", encoding="utf-8", buffering=1 << 20) as f:
+            reporter.stream(combined_report, f)
+        click.echo(f"HTML report saved to: {save_html}")
+    else:
+        # click.echo strips ANSI colors when stdout is not a TTY and copes with
+        # stdout encodings that cannot represent the report text.
+        click.echo(reporter.generate(combined_report))
 
 
 def _determine_exit_code(combined_report, fail_on, exclude_types, quiet, json_mode=False):
@@ -989,26 +1048,20 @@ def _determine_exit_code(combined_report, fail_on, exclude_types, quiet, json_mo
     exit_code = 0
 
     if fail_on:
-        severity_order = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
-        fail_on_idx = severity_order.index(fail_on.upper())
+        threshold = _SEV_RANK[fail_on.upper()]
 
         # Parse exclude_types for gate filtering
-        excluded_types = set()
-        if exclude_types:
-            excluded_types = {t.strip().upper() for t in exclude_types.split(",") if t.strip()}
-
-        # Filter issues for gate evaluation (exclude specified types)
-        gate_issues = [
-            issue
-            for issue in combined_report.get_all_issues()
+        excluded_types = frozenset(t.strip().upper() for t in exclude_types.split(",") if t.strip())
+
+        # Gate on non-excluded issues; stops at the first one over threshold
+        # without flattening every file's issue list first.
+        if any(
+            _SEV_RANK[issue.severity.value] >= threshold
+            for file_result in combined_report.file_results
+            for issue in file_result.issues
             if issue.issue_type.value not in excluded_types
-        ]
-
-        for issue in gate_issues:
-            issue_idx = severity_order.index(issue.severity.value)
-            if issue_idx >= fail_on_idx:
-                exit_code = 1
-                break
+        ):
+            exit_code = 1
 
         if exit_code == 1 and not quiet:
             click.echo(
@@ -1066,26 +1119,27 @@ def drift(template_file, region, stack_name, tags, fail_on):
     )
 
     # Print Report
-    click.echo("\nDrift Analysis Report")
-    click.echo("---------------------")
-    click.echo(f"Region: {result.summary['region']}")
-    if result.summary.get("stack_name"):
-        click.echo(f"Stack: {result.summary['stack_name']}")
-
-    click.echo(f"\nFindings: {len(result.findings)}")
-    for finding in result.findings:
-        click.echo(f"- [{finding.severity}] {finding.evidence}")
+    summary = result.summary
+    findings = result.findings
+    lines = ["\nDrift Analysis Report", "---------------------"]
+    lines.append(f"Region: {summary['region']}")
+    stack_name = summary.get("stack_name")
+    if stack_name:
+        lines.append(f"Stack: {stack_name}")
+
+    lines.append(f"\nFindings: {len(findings)}")
+    lines.extend(f"- [{finding.severity}] {finding.evidence}" for finding in findings)
+    click.echo("\n".join(lines))
 
     # Exit Code Logic
     exit_code = 0
-    severity_map = {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
 
     # Determine threshold (default to HIGH if not specified)
     threshold_level = fail_on if fail_on else "HIGH"
-    threshold = severity_map[threshold_level]
+    threshold = _SEV_RANK[threshold_level]
 
-    for finding in result.findings:
-        if severity_map.get(finding.severity, 0) >= threshold:
+    for finding in findings:
+        if _SEV_RANK.get(finding.severity, 0) >= threshold:
             exit_code = 2
             break
 
@@ -1138,5 +1192,9 @@ def _build_enrich_config(
     )
 
 
+# Top-level command names, resolved once all commands are registered.
+_KNOWN_CMDS = frozenset(cli.commands)
+
+
 if __name__ == "__main__":
     main()
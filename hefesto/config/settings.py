@@ -6,10 +6,10 @@ Loads configuration from environment variables with sensible defaults.
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Hefesto configuration settings."""
 
@@ -20,19 +20,18 @@ class Settings:
     @classmethod
     def from_env(cls) -> "Settings":
         """Load settings from environment variables."""
+        env = os.environ
         return cls(
-            version=os.getenv("HEFESTO_VERSION", "4.9.0"),
-            environment=os.getenv("HEFESTO_ENV", "production"),
+            version=env.get("HEFESTO_VERSION", "4.9.0"),
+            environment=env.get("HEFESTO_ENV", "production"),
         )
 
 
-# Singleton instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get singleton Settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
-    return _settings
+    """Get singleton Settings instance.
+
+    Environment is read once per process; call ``get_settings.cache_clear()``
+    to pick up changed variables (tests do this after setting their env).
+    """
+    return Settings.from_env()
@@ -4,45 +4,54 @@ Hefesto Core Analysis Engine.
 This module contains the core orchestration logic for code analysis.
 """
 
-# Import core models
-# Enums; Validation Models; Code Issue Models; Feedback Models
-# Budget Models; LLM Event Models; Semantic Models (Pro)
-# CICD Models (Pro); License Models; Utility Functions
-from hefesto.core.models import (
-    BudgetStatus,
-    BudgetStatusInfo,
-    BudgetSummary,
-    CodeEmbedding,
-    CodeIssue,
-    DeploymentFeedback,
-    FeedbackMetrics,
-    IssueCategory,
-    IssueSeverity,
-    LicenseInfo,
-    LLMEvent,
-    LLMModel,
-    RefactoringRequest,
-    RefactoringResponse,
-    SimilarityResult,
-    SuggestionAction,
-    SuggestionFeedback,
-    SuggestionValidationResult,
-    TestFeedback,
-    TokenUsage,
-    ValidationResult,
-    ValidationStatus,
-    generate_deployment_id,
-    generate_event_id,
-    generate_suggestion_id,
-)
+import importlib
+import importlib.util
 
-# Try to import analyzer engine if it exists
-try:
-    from hefesto.core.analyzer_engine import AnalyzerEngine  # noqa: F401
+# Core models are imported on first attribute access (PEP 562) so that
+# importing a submodule such as hefesto.core.analysis_models does not pay
+# for the pydantic model definitions in hefesto.core.models.
+_LAZY = {
+    "BudgetStatus": "hefesto.core.models",
+    "BudgetStatusInfo": "hefesto.core.models",
+    "BudgetSummary": "hefesto.core.models",
+    "CodeEmbedding": "hefesto.core.models",
+    "CodeIssue": "hefesto.core.models",
+    "DeploymentFeedback": "hefesto.core.models",
+    "FeedbackMetrics": "hefesto.core.models",
+    "IssueCategory": "hefesto.core.models",
+    "IssueSeverity": "hefesto.core.models",
+    "LicenseInfo": "hefesto.core.models",
+    "LLMEvent": "hefesto.core.models",
+    "LLMModel": "hefesto.core.models",
+    "RefactoringRequest": "hefesto.core.models",
+    "RefactoringResponse": "hefesto.core.models",
+    "SimilarityResult": "hefesto.core.models",
+    "SuggestionAction": "hefesto.core.models",
+    "SuggestionFeedback": "hefesto.core.models",
+    "SuggestionValidationResult": "hefesto.core.models",
+    "TestFeedback": "hefesto.core.models",
+    "TokenUsage": "hefesto.core.models",
+    "ValidationResult": "hefesto.core.models",
+    "ValidationStatus": "hefesto.core.models",
+    "generate_deployment_id": "hefesto.core.models",
+    "generate_event_id": "hefesto.core.models",
+    "generate_suggestion_id": "hefesto.core.models",
+    "AnalyzerEngine": "hefesto.core.analyzer_engine",
+}
 
-    _has_analyzer = True
-except ImportError:
-    _has_analyzer = False
+
+def __getattr__(name):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+# Probe for the analyzer engine without executing it; a genuine ImportError
+# inside the module then surfaces on first use instead of being swallowed.
+_has_analyzer = importlib.util.find_spec("hefesto.core.analyzer_engine") is not None
 
 __all__ = [
     # Enums
@@ -12,10 +12,31 @@ Pipeline:
 Copyright © 2025 Narapa LLC, Miami, Florida
 """
 
+import fnmatch
+import importlib
 import logging
+import os
+import re
 import time
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 from hefesto.core.analysis_models import (
     AnalysisIssue,
@@ -47,6 +68,83 @@ DEFAULT_EXCLUDES = [
     ".egg-info/",
 ]
 
+# Files larger than this are skipped and reported in parser_failures: multi-MB
+# sources are almost always generated or vendored and would be held in source_cache.
+DEFAULT_MAX_FILE_BYTES = 5 * 1024 * 1024
+
+
+# Severity -> rank, for threshold comparisons.
+_SEV_RANK = {
+    AnalysisIssueSeverity.LOW: 0,
+    AnalysisIssueSeverity.MEDIUM: 1,
+    AnalysisIssueSeverity.HIGH: 2,
+    AnalysisIssueSeverity.CRITICAL: 3,
+}
+
+
+# DevOps languages analyzed without a TreeSitter parser: language -> (module, class).
+_DEVOPS_ANALYZERS = {
+    Language.YAML: ("hefesto.analyzers.devops.yaml_analyzer", "YamlAnalyzer"),
+    Language.SHELL: ("hefesto.analyzers.devops.shell_analyzer", "ShellAnalyzer"),
+    Language.DOCKERFILE: ("hefesto.analyzers.devops.dockerfile_analyzer", "DockerfileAnalyzer"),
+    Language.TERRAFORM: ("hefesto.analyzers.devops.terraform_analyzer", "TerraformAnalyzer"),
+    Language.SQL: ("hefesto.analyzers.devops.sql_analyzer", "SqlAnalyzer"),
+    Language.COBOL: (
+        "hefesto.analyzers.devops.cobol_governance_analyzer",
+        "CobolGovernanceAnalyzer",
+    ),
+}
+
+
+def _count_loc(code: str) -> int:
+    """Count lines that are neither blank nor ``#`` comments."""
+    loc = 0
+    for line in code.split("\n"):
+        stripped = line.lstrip()
+        if stripped and stripped[0] != "#":
+            loc += 1
+    return loc
+
+
+def compile_excludes(exclude_patterns: Optional[List[str]] = None) -> Pattern[str]:
+    """Compile DEFAULT_EXCLUDES plus user patterns into a single matcher.
+
+    Patterns keep their substring semantics (``"tests/"`` matches anywhere in
+    the path); the escaped alternation lets one ``re.search`` per file replace
+    one ``in`` test per pattern. Matchers are memoized per pattern tuple, so
+    callers passing the same raw list to ``analyze_path`` compile it once.
+    """
+    return _compile_excludes(tuple(exclude_patterns or ()))
+
+
+@lru_cache(maxsize=32)
+def _compile_excludes(user_patterns: Tuple[str, ...]) -> Pattern[str]:
+    patterns = (*DEFAULT_EXCLUDES, *user_patterns)
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+# Special filenames not yet in specs; only these pay for full language detection.
+_FALLBACK_NAMES = frozenset(("Makefile", "makefile", "Containerfile", "containerfile"))
+
+
+@lru_cache(maxsize=1)
+def _supported_name_matchers() -> Tuple[FrozenSet[str], Pattern[str]]:
+    """Split the registry globs for case-sensitive file discovery.
+
+    Plain ``*.ext`` globs become a set of suffixes so most names are
+    classified with one lookup; the rest (Dockerfile.*, *.tf.json, etc.) are
+    folded into one regex.
+    """
+    suffixes = set()
+    others = []
+    for glob in LanguageDetector.get_supported_file_globs():
+        ext = glob[2:]
+        if glob.startswith("*.") and ext and not any(c in ext for c in ".*?["):
+            suffixes.add(ext)
+        else:
+            others.append(fnmatch.translate(glob))
+    return frozenset(suffixes), re.compile("|".join(others) or r"(?!)")
+
 
 class AnalyzerEngine:
     """Main analysis engine that orchestrates all analyzers."""
@@ -58,6 +156,9 @@ class AnalyzerEngine:
         scope_config: Any = None,
         enrich_config: Any = None,
         quiet: bool = False,
+        jobs: int = 1,
+        max_file_bytes: Optional[int] = DEFAULT_MAX_FILE_BYTES,
+        cache_sources: bool = True,
     ):
         """
         Initialize analyzer engine.
@@ -68,22 +169,33 @@ class AnalyzerEngine:
             scope_config: Optional ScopeGatingConfig (PRO feature, None = no gating)
             enrich_config: Optional EnrichmentConfig (PRO feature, None = no enrichment)
             quiet: Suppress non-essential stderr output, including parser-skip warnings
+            jobs: Worker processes for per-file analysis (default: 1, sequential)
+            max_file_bytes: Skip files larger than this, recording them as
+                ``file_too_large`` parser failures (default: 5 MiB, None = no limit)
+            cache_sources: Keep each file's source in ``source_cache`` for
+                post-analysis consumers such as ML duplicate detection
         """
         self.severity_threshold = AnalysisIssueSeverity(severity_threshold)
+        self.jobs = max(1, jobs)
+        self.max_file_bytes = max_file_bytes
         self.analyzers: List[Any] = []
         self._project_analyzers: List[Any] = []
         self.verbose = verbose
         self._quiet = quiet
         self._registry = get_registry()
         self.source_cache: dict = {}  # ML Enhancement: cache source for semantic analysis
+        self.cache_sources = cache_sources
         self._scope_config = scope_config
         self._enrich_config = enrich_config
         self._enrich_orchestrator: Any = None
         self._scope_skipped: list = []
         self._multilang_skip_report: Any = None
         self._tsjs_parser: Any = None
+        self._multilang_loaded = False  # TS/JS parser is built on first use
         self._all_file_results: list = []  # EPIC 4: accumulated for _build_meta
         self._parser_failures: List[Dict[str, Any]] = []  # files skipped due to parser errors
+        self._parsers: Dict[Language, Any] = {}  # one parser per language, built on first use
+        self._devops_analyzers: Dict[Language, Any] = {}  # same, for DevOps analyzers
 
         # Initialize enrichment orchestrator if config provided
         if enrich_config is not None:
@@ -92,14 +204,6 @@ class AnalyzerEngine:
             if HAS_ENRICHMENT and EnrichmentOrchestrator is not None:
                 self._enrich_orchestrator = EnrichmentOrchestrator([])
 
-        # Initialize multilang parser + skip report if available
-        from hefesto.pro_optional import HAS_MULTILANG, SkipReport, TsJsParser
-
-        if HAS_MULTILANG and TsJsParser is not None:
-            self._tsjs_parser = TsJsParser()
-        if HAS_MULTILANG and SkipReport is not None:
-            self._multilang_skip_report = SkipReport()
-
     def register_analyzer(self, analyzer):
         """Register an analyzer instance."""
         self.analyzers.append(analyzer)
@@ -115,19 +219,26 @@ class AnalyzerEngine:
         self._project_analyzers.append(analyzer)
 
     def analyze_path(
-        self, path: str, exclude_patterns: Optional[List[str]] = None
+        self,
+        path: str,
+        exclude_patterns: Optional[Union[List[str], Pattern[str]]] = None,
+        result_sink: Optional[Callable[[FileAnalysisResult], None]] = None,
     ) -> AnalysisReport:
         """
         Analyze a file or directory with complete Phase 0+1 pipeline.
 
         Args:
             path: File or directory path to analyze
-            exclude_patterns: List of patterns to exclude (e.g., ["tests/", "docs/"])
+            exclude_patterns: List of patterns to exclude (e.g., ["tests/", "docs/"]),
+                or a matcher from ``compile_excludes`` to reuse across calls
+            result_sink: If given, each finished FileAnalysisResult is passed
+                to it instead of being kept; the returned report then carries
+                only the summary and results do not feed ``_build_meta``
 
         Returns:
             AnalysisReport with all findings
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if self.verbose:
             print("\n HEFESTO ANALYSIS PIPELINE")
@@ -156,11 +267,22 @@ class AnalyzerEngine:
         if self.verbose:
             print("Running static analyzers...")
 
+        if result_sink is not None:
+            summary = self._create_summary(
+                self._stream_results(source_files, path_obj, result_sink), 0.0
+            )
+            summary.duration_seconds = time.perf_counter() - start_time
+            self._emit_skip_summary()
+            if self.verbose:
+                print(f"   Found {summary.total_issues} potential issue(s)")
+                print(f"   Duration: {summary.duration_seconds:.2f}s")
+                print()
+            return AnalysisReport(summary=summary, file_results=[])
+
         file_results = []
         all_issues = []
 
-        for py_file in source_files:
-            file_result = self._analyze_file(py_file)
+        for file_result in self._analyze_many(source_files):
             if file_result:
                 file_results.append(file_result)
                 all_issues.extend(file_result.issues)
@@ -181,7 +303,7 @@ class AnalyzerEngine:
             print()
 
         # Calculate final statistics
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         summary = self._create_summary(file_results, duration)
 
         # Accumulate for _build_meta (EPIC 4)
@@ -217,7 +339,7 @@ class AnalyzerEngine:
         available — the PR review orchestrator filters them afterwards
         by ``finding.file_path`` membership in the diff set.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         file_path_objs = [Path(p).resolve() for p in paths]
         if project_root is not None:
@@ -250,10 +372,8 @@ class AnalyzerEngine:
         file_results: List[FileAnalysisResult] = []
         all_issues: List[AnalysisIssue] = []
 
-        for py_file in file_path_objs:
-            if not py_file.exists() or not py_file.is_file():
-                continue
-            file_result = self._analyze_file(py_file)
+        file_path_objs = [p for p in file_path_objs if p.is_file()]
+        for file_result in self._analyze_many(file_path_objs):
             if file_result:
                 file_results.append(file_result)
                 all_issues.extend(file_result.issues)
@@ -268,7 +388,7 @@ class AnalyzerEngine:
         if self._enrich_orchestrator is not None and self._enrich_config is not None:
             self._enrich_findings(file_results)
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         summary = self._create_summary(file_results, duration)
 
         self._all_file_results.extend(file_results)
@@ -276,14 +396,16 @@ class AnalyzerEngine:
         self._emit_skip_summary()
         return AnalysisReport(summary=summary, file_results=file_results)
 
-    def _find_files(self, path: Path, exclude_patterns: List[str]) -> List[Path]:
+    def _find_files(
+        self, path: Path, exclude_patterns: Union[List[str], Pattern[str]]
+    ) -> List[Path]:
         """Find all supported files in the given path."""
-        # Merge default excludes with user-provided patterns
-        all_excludes = list(DEFAULT_EXCLUDES) + list(exclude_patterns)
-
-        def excluded(p: Path) -> bool:
-            sp = str(p)
-            return any(pattern in sp for pattern in all_excludes)
+        # Merge default excludes with user-provided patterns (already merged
+        # when the caller hands us a compiled matcher).
+        if isinstance(exclude_patterns, re.Pattern):
+            matcher = exclude_patterns
+        else:
+            matcher = compile_excludes(exclude_patterns)
 
         # If a single file is provided, evaluate support with shebang-aware detection.
         if path.is_file():
@@ -293,38 +415,118 @@ class AnalyzerEngine:
                 txt = None
             return [path] if LanguageDetector.is_supported(path, txt) else []
 
-        supported_files: List[Path] = []
+        suffixes, name_re = _supported_name_matchers()
 
-        # Use registry-backed globs to discover files (Dockerfile.*, *.tf.json, etc.)
-        for glob in LanguageDetector.get_supported_file_globs():
-            for file in path.rglob(glob):
-                if excluded(file) or not file.is_file():
-                    continue
-                supported_files.append(file)
+        # Everything under an excluded root is excluded; skip the walk.
+        if matcher.search(str(path) + os.sep) is not None:
+            return []
 
-        # Optional: keep a small fallback for common special filenames not yet in specs.
-        fallback_names = ("Makefile", "makefile", "Containerfile", "containerfile")
-        for name in fallback_names:
-            for file in path.rglob(name):
-                if excluded(file) or not file.is_file():
+        supported_files: List[Path] = []
+        for dirpath, names in self._walk(path, matcher):
+            for name in names:
+                # Classify by name first (suffix lookup, then the few compound
+                # globs); only candidates pay for the exclude search.
+                _, dot, ext = name.rpartition(".")
+                matched = (dot and ext in suffixes) or name_re.match(name) is not None
+                if not matched and name not in _FALLBACK_NAMES:
                     continue
-                if LanguageDetector.is_supported(file):
+                full = os.path.join(dirpath, name)
+                if matcher.search(full) is not None:
+                    continue
+                file = Path(full)
+                if matched or LanguageDetector.is_supported(file):
                     supported_files.append(file)
 
-        # Dedupe preserving order
-        return list(dict.fromkeys(supported_files))
+        return supported_files
+
+    @staticmethod
+    def _walk(root: Path, matcher: Pattern[str]) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(dirpath, file_names)`` for every directory under ``root``.
+
+        Single ``os.scandir`` traversal, pre-order like ``Path.rglob``. Symlinked
+        directories are not descended into; symlinked files are reported. A
+        directory whose path already matches an exclude is pruned whole, since
+        every file beneath it would match too.
+        """
+        stack = [str(root)]
+        while stack:
+            dirpath = stack.pop()
+            files: List[str] = []
+            subdirs: List[str] = []
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if matcher.search(entry.path + os.sep) is None:
+                                    subdirs.append(entry.path)
+                            elif entry.is_file():
+                                files.append(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            yield dirpath, files
+            stack.extend(reversed(subdirs))
+
+    def _analyze_many(self, files: List[Path]) -> Iterator[Optional[FileAnalysisResult]]:
+        """Analyze ``files`` in order, fanning out to worker processes if enabled.
 
-    def _analyze_file(self, file_path: Path) -> Optional[FileAnalysisResult]:
-        """Analyze a single file (multi-language support)."""
-        start_time = time.time()
+        Runs sequentially unless ``jobs > 1`` and there are enough files to
+        amortize pool startup. The PRO multilang parser keeps a per-engine
+        skip report, so engines with it attached also stay sequential.
+        Workers return each file's source and parser failures so
+        ``source_cache`` and the skip summary match a sequential run.
+        """
+        workers = min(self.jobs, len(files), os.cpu_count() or 1)
+        if workers < 2 or len(files) < _MIN_PARALLEL_FILES or self._load_multilang() is not None:
+            for file_path, code in _read_ahead(files, self.max_file_bytes):
+                yield self._analyze_file(file_path, code)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(files) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                self.severity_threshold.value,
+                self.analyzers,
+                self.max_file_bytes,
+                self.cache_sources,
+            ),
+        ) as pool:
+            for result, key, code, failures in pool.map(
+                _analyze_file_worker, files, chunksize=chunksize
+            ):
+                if code is not None:
+                    self.source_cache[key] = code
+                self._parser_failures.extend(failures)
+                yield result
+
+    def _analyze_file(
+        self, file_path: Path, code: Optional[str] = None
+    ) -> Optional[FileAnalysisResult]:
+        """Analyze a single file (multi-language support).
+
+        ``code`` may be supplied when the source was already read ahead;
+        otherwise the file is read here.
+        """
+        start_time = time.perf_counter()
         file_path = file_path.resolve()
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                code = f.read()
+            if code is None:
+                try:
+                    code = _read_source(file_path, self.max_file_bytes)
+                except _FileTooLargeError as exc:
+                    self._record_too_large(file_path, exc.size)
+                    return None
 
             # Cache source for ML semantic analysis (Phase 1)
-            self.source_cache[str(file_path)] = code
+            if self.cache_sources:
+                self.source_cache[str(file_path)] = code
 
             # Detect language
             language = LanguageDetector.detect(file_path, code)
@@ -332,89 +534,13 @@ class AnalyzerEngine:
                 return None
 
             # Calculate LOC early (for all languages including DevOps)
-            loc = len(
-                [ln for ln in code.split("\n") if ln.strip() and not ln.strip().startswith("#")]
-            )
+            loc = _count_loc(code)
 
             # DevOps languages - use dedicated analyzers without TreeSitter parser
-            if language == Language.YAML:
-                from hefesto.analyzers.devops.yaml_analyzer import YamlAnalyzer
-
-                yaml_issues = YamlAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(yaml_issues)
-                duration_ms = (time.time() - start_time) * 1000
-                return FileAnalysisResult(
-                    file_path=str(file_path),
-                    issues=filtered_issues,
-                    lines_of_code=loc,
-                    analysis_duration_ms=duration_ms,
-                    language=language.value,
-                )
-
-            elif language == Language.SHELL:
-                from hefesto.analyzers.devops.shell_analyzer import ShellAnalyzer
-
-                shell_issues = ShellAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(shell_issues)
-                duration_ms = (time.time() - start_time) * 1000
-                return FileAnalysisResult(
-                    file_path=str(file_path),
-                    issues=filtered_issues,
-                    lines_of_code=loc,
-                    analysis_duration_ms=duration_ms,
-                    language=language.value,
-                )
-
-            elif language == Language.DOCKERFILE:
-                from hefesto.analyzers.devops.dockerfile_analyzer import DockerfileAnalyzer
-
-                docker_issues = DockerfileAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(docker_issues)
-                duration_ms = (time.time() - start_time) * 1000
-                return FileAnalysisResult(
-                    file_path=str(file_path),
-                    issues=filtered_issues,
-                    lines_of_code=loc,
-                    analysis_duration_ms=duration_ms,
-                    language=language.value,
-                )
-
-            elif language == Language.TERRAFORM:
-                from hefesto.analyzers.devops.terraform_analyzer import TerraformAnalyzer
-
-                tf_issues = TerraformAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(tf_issues)
-                duration_ms = (time.time() - start_time) * 1000
-                return FileAnalysisResult(
-                    file_path=str(file_path),
-                    issues=filtered_issues,
-                    lines_of_code=loc,
-                    analysis_duration_ms=duration_ms,
-                    language=language.value,
-                )
-
-            elif language == Language.SQL:
-                from hefesto.analyzers.devops.sql_analyzer import SqlAnalyzer
-
-                sql_issues = SqlAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(sql_issues)
-                duration_ms = (time.time() - start_time) * 1000
-                return FileAnalysisResult(
-                    file_path=str(file_path),
-                    issues=filtered_issues,
-                    lines_of_code=loc,
-                    analysis_duration_ms=duration_ms,
-                    language=language.value,
-                )
-
-            elif language == Language.COBOL:
-                from hefesto.analyzers.devops.cobol_governance_analyzer import (
-                    CobolGovernanceAnalyzer,
-                )
-
-                cobol_issues = CobolGovernanceAnalyzer().analyze(str(file_path), code)
-                filtered_issues = self._filter_by_severity(cobol_issues)
-                duration_ms = (time.time() - start_time) * 1000
+            if language in _DEVOPS_ANALYZERS:
+                devops_issues = self._get_devops_analyzer(language).analyze(str(file_path), code)
+                filtered_issues = self._filter_by_severity(devops_issues)
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 return FileAnalysisResult(
                     file_path=str(file_path),
                     issues=filtered_issues,
@@ -424,7 +550,9 @@ class AnalyzerEngine:
                 )
 
             try:
-                parser = ParserFactory.get_parser(language)
+                parser = self._parsers.get(language)
+                if parser is None:
+                    parser = self._parsers[language] = ParserFactory.get_parser(language)
                 tree = parser.parse(code, str(file_path))
             except Exception as exc:
                 self._parser_failures.append(
@@ -443,16 +571,24 @@ class AnalyzerEngine:
             # Multilang symbol extraction (PRO EPIC 2): TS/JS metadata
             file_meta = self._extract_multilang_symbols(file_path, code, language)
 
-            # Run all analyzers
-            all_issues = []
+            # Run all analyzers, skipping any whose declared max_severity
+            # could never reach the threshold, and filter by severity as
+            # findings are collected.
+            rank = _SEV_RANK
+            threshold = rank[self.severity_threshold]
+            path_str = str(file_path)
+            filtered_issues = []
             for analyzer in self.analyzers:
-                issues = analyzer.analyze(tree, str(file_path), code)
-                all_issues.extend(issues)
-
-            # Filter by severity threshold
-            filtered_issues = self._filter_by_severity(all_issues)
+                max_sev = getattr(analyzer, "max_severity", AnalysisIssueSeverity.CRITICAL)
+                if rank[max_sev] < threshold:
+                    continue
+                filtered_issues.extend(
+                    issue
+                    for issue in analyzer.analyze(tree, path_str, code)
+                    if rank[issue.severity] >= threshold
+                )
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             result = FileAnalysisResult(
                 file_path=str(file_path),
@@ -469,6 +605,31 @@ class AnalyzerEngine:
             # Skip files that can't be read or analyzed
             return None
 
+    def _record_too_large(self, file_path: Path, size: int) -> None:
+        """Record a file skipped by ``max_file_bytes`` with the parser failures."""
+        language = LanguageDetector.detect(file_path)
+        if language == Language.UNKNOWN:
+            return
+        self._parser_failures.append(
+            {
+                "path": str(file_path),
+                "language": language.value,
+                "category": "file_too_large",
+                "exception": _FileTooLargeError.__name__,
+                "bytes": size,
+            }
+        )
+        logger.debug("Skipping %s: %d bytes exceeds max_file_bytes", file_path, size)
+
+    def _get_devops_analyzer(self, language: Language) -> Any:
+        """Return the DevOps analyzer for ``language``, importing it on first use."""
+        analyzer = self._devops_analyzers.get(language)
+        if analyzer is None:
+            module_path, class_name = _DEVOPS_ANALYZERS[language]
+            analyzer_cls = getattr(importlib.import_module(module_path), class_name)
+            analyzer = self._devops_analyzers[language] = analyzer_cls()
+        return analyzer
+
     def _run_project_analyzers(self, project_root: Path) -> List[AnalysisIssue]:
         """Run registered project-level analyzers once against the project root.
 
@@ -514,18 +675,46 @@ class AnalyzerEngine:
                 file_results.append(target)
             target.issues.append(issue)
 
+    def _stream_results(
+        self,
+        source_files: List[Path],
+        project_root: Path,
+        sink: Callable[[FileAnalysisResult], None],
+    ) -> Iterator[FileAnalysisResult]:
+        """Hand each file result to ``sink`` as soon as it is final.
+
+        Project-level findings are computed first so they can be merged into
+        their file's result before it leaves; the rest become synthetic
+        results, as in ``_fold_project_issues``. Yields each result after the
+        sink for ``_create_summary`` to count, then drops it.
+        """
+        pending: Dict[str, List[AnalysisIssue]] = {}
+        if self._project_analyzers:
+            for issue in self._run_project_analyzers(project_root):
+                pending.setdefault(issue.file_path, []).append(issue)
+        enrich = self._enrich_orchestrator is not None and self._enrich_config is not None
+
+        def finished() -> Iterator[FileAnalysisResult]:
+            for file_result in self._analyze_many(source_files):
+                if file_result:
+                    file_result.issues.extend(pending.pop(file_result.file_path, ()))
+                    yield file_result
+            synthetic: List[FileAnalysisResult] = []
+            self._fold_project_issues(synthetic, [i for v in pending.values() for i in v])
+            yield from synthetic
+
+        for file_result in finished():
+            if enrich:
+                self._enrich_findings([file_result])
+            sink(file_result)
+            yield file_result
+
     def _filter_by_severity(self, issues: List[AnalysisIssue]) -> List[AnalysisIssue]:
         """Filter issues by severity threshold."""
-        severity_order = {
-            AnalysisIssueSeverity.LOW: 0,
-            AnalysisIssueSeverity.MEDIUM: 1,
-            AnalysisIssueSeverity.HIGH: 2,
-            AnalysisIssueSeverity.CRITICAL: 3,
-        }
+        rank = _SEV_RANK
+        threshold_value = rank[self.severity_threshold]
 
-        threshold_value = severity_order[self.severity_threshold]
-
-        return [issue for issue in issues if severity_order[issue.severity] >= threshold_value]
+        return [issue for issue in issues if rank[issue.severity] >= threshold_value]
 
     def _categorize_parser_failure(
         self, exc: Exception, language: Optional["Language"] = None
@@ -580,6 +769,7 @@ class AnalyzerEngine:
 
         unavailable = [f for f in self._parser_failures if f["category"] == "parser_unavailable"]
         parse_errors = [f for f in self._parser_failures if f["category"] == "parse_error"]
+        too_large = [f for f in self._parser_failures if f["category"] == "file_too_large"]
 
         if unavailable:
             langs = sorted({f["language"] for f in unavailable})
@@ -598,36 +788,39 @@ class AnalyzerEngine:
                 f"   Run with --verbose for details.",
                 err=True,
             )
+        if too_large:
+            sample = ", ".join(f["path"] for f in too_large[:3])
+            more = f" (+{len(too_large) - 3} more)" if len(too_large) > 3 else ""
+            click.echo(
+                f"⚠️  Skipped {len(too_large)} file(s) — larger than "
+                f"{self.max_file_bytes} bytes: {sample}{more}",
+                err=True,
+            )
 
     def _create_summary(
-        self, file_results: List[FileAnalysisResult], duration: float
+        self, file_results: Iterable[FileAnalysisResult], duration: float
     ) -> AnalysisSummary:
         """Create summary statistics from file results."""
-        all_issues = []
+        # Single pass: LOC, real (non-synthetic) files and per-severity counts.
+        counts = dict.fromkeys(_SEV_RANK, 0)
         total_loc = 0
+        real_files = 0
 
         for file_result in file_results:
-            all_issues.extend(file_result.issues)
             total_loc += file_result.lines_of_code
-
-        # Exclude synthetic project-level results from the files_analyzed count.
-        real_files = sum(1 for fr in file_results if not fr.metadata.get("synthetic"))
-
-        # Count by severity
-        critical = sum(
-            1 for issue in all_issues if issue.severity == AnalysisIssueSeverity.CRITICAL
-        )
-        high = sum(1 for issue in all_issues if issue.severity == AnalysisIssueSeverity.HIGH)
-        medium = sum(1 for issue in all_issues if issue.severity == AnalysisIssueSeverity.MEDIUM)
-        low = sum(1 for issue in all_issues if issue.severity == AnalysisIssueSeverity.LOW)
+            # Exclude synthetic project-level results from the files_analyzed count.
+            if not file_result.metadata.get("synthetic"):
+                real_files += 1
+            for issue in file_result.issues:
+                counts[issue.severity] += 1
 
         return AnalysisSummary(
             files_analyzed=real_files,
-            total_issues=len(all_issues),
-            critical_issues=critical,
-            high_issues=high,
-            medium_issues=medium,
-            low_issues=low,
+            total_issues=sum(counts.values()),
+            critical_issues=counts[AnalysisIssueSeverity.CRITICAL],
+            high_issues=counts[AnalysisIssueSeverity.HIGH],
+            medium_issues=counts[AnalysisIssueSeverity.MEDIUM],
+            low_issues=counts[AnalysisIssueSeverity.LOW],
             total_loc=total_loc,
             duration_seconds=duration,
         )
@@ -644,14 +837,15 @@ class AnalyzerEngine:
         Returns symbol dict to attach as file metadata, or empty dict.
         Does NOT re-read the file — uses ``code`` already in memory.
         """
-        if self._tsjs_parser is None:
-            return {}
-
         suffix = file_path.suffix.lower()
         if suffix not in self._TSJS_EXTENSIONS:
             return {}
 
-        result = self._tsjs_parser.parse_text(file_path, code)
+        parser = self._load_multilang()
+        if parser is None:
+            return {}
+
+        result = parser.parse_text(file_path, code)
 
         if result.skipped:
             if self._multilang_skip_report is not None:
@@ -669,6 +863,22 @@ class AnalyzerEngine:
             }
         }
 
+    def _load_multilang(self) -> Any:
+        """Build the PRO TS/JS parser and skip report on first use (EPIC 2).
+
+        Runs that never see a TS/JS file skip constructing the parser.
+        Returns the parser, or None when multilang is not installed.
+        """
+        if not self._multilang_loaded:
+            self._multilang_loaded = True
+            from hefesto.pro_optional import HAS_MULTILANG, SkipReport, TsJsParser
+
+            if HAS_MULTILANG and TsJsParser is not None:
+                self._tsjs_parser = TsJsParser()
+            if HAS_MULTILANG and SkipReport is not None:
+                self._multilang_skip_report = SkipReport()
+        return self._tsjs_parser
+
     def _enrich_findings(self, file_results: "List[FileAnalysisResult]") -> None:
         """Attach enrichment metadata to each finding (EPIC 3).
 
@@ -735,4 +945,106 @@ class AnalyzerEngine:
         return meta
 
 
-__all__ = ["AnalyzerEngine", "DEFAULT_EXCLUDES"]
+# Below this many files a process pool costs more to start than it saves.
+_MIN_PARALLEL_FILES = 4
+
+# Sources read ahead of the analyzer; bounds memory held by pending reads.
+_READ_AHEAD = 64
+
+
+class _FileTooLargeError(ValueError):
+    """A source file exceeds the engine's ``max_file_bytes``."""
+
+    def __init__(self, file_path: Path, size: int, max_bytes: int):
+        super().__init__(f"{file_path} is {size} bytes, larger than {max_bytes}")
+        self.size = size
+
+
+def _read_source(file_path: Path, max_bytes: Optional[int] = None) -> str:
+    """Read a UTF-8 source file, rejecting files over ``max_bytes``.
+
+    Reads bytes and decodes once rather than going through the text layer;
+    newlines are normalized to ``\\n`` as text mode would.
+    """
+    with open(file_path, "rb") as f:
+        if max_bytes is not None:
+            size = os.fstat(f.fileno()).st_size
+            if size > max_bytes:
+                raise _FileTooLargeError(file_path, size, max_bytes)
+        code = f.read().decode("utf-8")
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return code
+
+
+def _read_ahead(
+    files: List[Path], max_bytes: Optional[int] = None
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """Yield ``(path, source)`` in order while later files are read on threads.
+
+    Overlaps file I/O (slow on cold caches and network filesystems) with
+    analysis on the calling thread. At most ``_READ_AHEAD`` reads are in
+    flight. A failed read yields ``None`` so ``_analyze_file`` retries it
+    inline and handles the error as before.
+    """
+    if len(files) < 2:
+        for file_path in files:
+            yield file_path, None
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending: Deque[Tuple[Path, Future]] = deque()
+    remaining = iter(files)
+    threads = min(32, 4 * (os.cpu_count() or 1), len(files))
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for file_path in islice(remaining, _READ_AHEAD):
+            pending.append((file_path, pool.submit(_read_source, file_path, max_bytes)))
+        while pending:
+            file_path, future = pending.popleft()
+            nxt = next(remaining, None)
+            if nxt is not None:
+                pending.append((nxt, pool.submit(_read_source, nxt, max_bytes)))
+            try:
+                code: Optional[str] = future.result()
+            except Exception:
+                code = None
+            yield file_path, code
+
+
+_worker_engine: Optional[AnalyzerEngine] = None
+
+
+def _init_worker(
+    severity_threshold: str,
+    analyzers: List[Any],
+    max_file_bytes: Optional[int],
+    cache_sources: bool,
+) -> None:
+    """Build the per-process engine used by ``_analyze_file_worker``."""
+    global _worker_engine
+    _worker_engine = AnalyzerEngine(
+        severity_threshold=severity_threshold,
+        quiet=True,
+        max_file_bytes=max_file_bytes,
+        cache_sources=cache_sources,
+    )
+    _worker_engine.analyzers = analyzers
+
+
+def _analyze_file_worker(
+    file_path: Path,
+) -> Tuple[Optional[FileAnalysisResult], str, Optional[str], List[Dict[str, Any]]]:
+    """Analyze one file in a worker; hand back the state the parent engine keeps."""
+    engine = _worker_engine
+    if engine is None:
+        raise RuntimeError("worker engine not initialized")
+    result = engine._analyze_file(file_path)
+    key = str(file_path.resolve())
+    code = engine.source_cache.pop(key, None)
+    failures = engine._parser_failures[:]
+    engine._parser_failures.clear()
+    return result, key, code, failures
+
+
+__all__ = ["AnalyzerEngine", "DEFAULT_EXCLUDES", "DEFAULT_MAX_FILE_BYTES", "compile_excludes"]
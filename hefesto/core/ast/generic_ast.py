@@ -27,9 +27,42 @@ class NodeType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class _NodeText:
+    """``GenericNode.text``: an explicit string, or decoded on first read.
+
+    Parsers pass the UTF-8 encoded source plus byte offsets instead of
+    slicing every node up front; most nodes are never asked for their text.
+    Wraps the ``text`` slot, which holds the explicit or cached string.
+    """
+
+    def __init__(self, slot: Any) -> None:
+        self._slot = slot
+
+    def __get__(self, node: Optional["GenericNode"], owner: Any = None) -> Any:
+        if node is None:
+            return self
+        text = self._slot.__get__(node, owner)
+        if text is None:
+            source = node.source
+            text = (
+                source[node.start_offset : node.end_offset].decode("utf-8", errors="replace")
+                if source is not None
+                else ""
+            )
+            self._slot.__set__(node, text)
+        return text
+
+    def __set__(self, node: "GenericNode", value: Optional[str]) -> None:
+        self._slot.__set__(node, value)
+
+
+@dataclass(slots=True)
 class GenericNode:
-    """Language-agnostic AST node."""
+    """Language-agnostic AST node.
+
+    Slotted: large scans build one instance per syntax node, and dropping
+    the per-instance ``__dict__`` more than halves their footprint.
+    """
 
     type: NodeType
     name: Optional[str]
@@ -37,9 +70,13 @@ class GenericNode:
     line_end: int
     column_start: int
     column_end: int
-    text: str
+    text: str = None  # type: ignore[assignment]  # None: sliced from source on read
     children: List["GenericNode"] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Lazy text: UTF-8 source and the node's byte span within it.
+    source: Optional[bytes] = field(default=None, repr=False, compare=False)
+    start_offset: int = field(default=0, repr=False, compare=False)
+    end_offset: int = field(default=0, repr=False, compare=False)
 
     def find_children_by_type(self, node_type: NodeType) -> List["GenericNode"]:
         """Find all direct children of a specific type."""
@@ -61,6 +98,9 @@ class GenericNode:
         return count
 
 
+GenericNode.text = _NodeText(GenericNode.text)  # type: ignore[assignment, misc]
+
+
 class GenericAST:
     """Language-agnostic Abstract Syntax Tree."""
 
@@ -12,12 +12,37 @@ from hefesto.analyzers.cloud.drift.base import DriftContext
 from hefesto.analyzers.cloud.finding_schema import CloudFinding
 from hefesto.analyzers.cloud.graph.resolver import (
     NameResolver,
+    ResolverCache,
     ResolverStrategy,
     ResourceResolver,
     StackResolver,
     TagResolver,
 )
 
+# libyaml's C loader when PyYAML was built with it; same safe-load semantics.
+_YAML_BASE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _TemplateLoader(_YAML_BASE_LOADER):  # type: ignore[misc, valid-type]
+    """Safe loader that reads CloudFormation short-form intrinsics (``!Ref``, ...)."""
+
+
+def _construct_intrinsic(loader: Any, tag_suffix: str, node: Any) -> Dict[str, Any]:
+    """Expand ``!Name value`` into the long form the detectors already walk."""
+    if isinstance(node, yaml.ScalarNode):
+        value: Any = loader.construct_scalar(node)
+        if tag_suffix == "GetAtt":
+            value = value.split(".", 1)
+    elif isinstance(node, yaml.SequenceNode):
+        value = loader.construct_sequence(node, deep=True)
+    else:
+        value = loader.construct_mapping(node, deep=True)
+    key = tag_suffix if tag_suffix in ("Ref", "Condition") else f"Fn::{tag_suffix}"
+    return {key: value}
+
+
+_TemplateLoader.add_multi_constructor("!", _construct_intrinsic)
+
 
 @dataclass(frozen=True)
 class DriftRunResult:
@@ -29,8 +54,16 @@ class DriftRunner:
     """
     Runtime drift runner. Loads IaC template, configures resolver strategies with CLI args,
     initializes DriftContext, and runs detection.
+
+    Resolver results are cached on the runner (or on a cache passed in and shared
+    between runners), so library callers running several templates that share a
+    stack, tags or security group names repeat no AWS lookups. The ``drift`` CLI
+    runs one template per process and gains nothing from it.
     """
 
+    def __init__(self, cache: Optional[ResolverCache] = None):
+        self.cache = cache if cache is not None else ResolverCache()
+
     def run(
         self,
         template_path: str,
@@ -49,9 +82,12 @@ class DriftRunner:
             strategies.append(TagResolver(explicit_tags=tags))
             strategies.append(NameResolver())
 
-        resolver = ResourceResolver(strategies=strategies) if autoresolve else None
+        resolver = (
+            ResourceResolver(strategies=strategies, cache=self.cache) if autoresolve else None
+        )
 
         resource_map = {}
+        hits_before, misses_before = self.cache.hits, self.cache.misses
         if resolver:
             # Resolve physical IDs
             # Note: We pass None for session/credentials here to let resolver
@@ -82,13 +118,15 @@ class DriftRunner:
             "stack_name": stack_name,
             "autoresolve": autoresolve,
             "resolved_resources": resolved_count,
+            "resolver_cache_hits": self.cache.hits - hits_before,
+            "resolver_cache_misses": self.cache.misses - misses_before,
             "findings": len(findings),
         }
         return DriftRunResult(findings=findings, summary=summary)
 
     def _load_template(self, path: str) -> Dict[str, Any]:
         p = Path(path)
-        if not p.exists() or not p.is_file():
+        if not p.is_file():
             raise FileNotFoundError(f"Template not found: {path}")
 
         raw = p.read_text(encoding="utf-8")
@@ -100,14 +138,14 @@ class DriftRunner:
 
         # YAML
         if suffix in (".yml", ".yaml"):
-            data = yaml.safe_load(raw)
+            data = yaml.load(raw, Loader=_TemplateLoader)
             if not isinstance(data, dict):
                 raise ValueError("Template must parse to a dict/object at root level.")
             return data
 
         # Fallback
         try:
-            data = yaml.safe_load(raw)
+            data = yaml.load(raw, Loader=_TemplateLoader)
             if isinstance(data, dict):
                 return data
         except Exception:
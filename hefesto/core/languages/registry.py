@@ -6,12 +6,34 @@ Provides lookup and resolution of language specs, providers, and analyzers.
 Copyright 2025 Narapa LLC, Miami, Florida
 """
 
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Literal, Optional, Pattern, Set, Tuple
 
 from hefesto.core.languages.specs import LANGUAGE_SPECS, Language, LanguageSpec, ProviderRef
 
+# Named groups, so fnmatch's own groups inside a translated glob (Python 3.10
+# adds some) cannot shift which alternative a match maps back to.
+_ALT_GROUP = "hefesto_alt"
+
+
+def _alternation(regexes: Iterable[str]) -> Pattern[str]:
+    """Compile regexes into one alternation, one named group per regex."""
+    return re.compile("|".join(f"(?P<{_ALT_GROUP}{i}>{r})" for i, r in enumerate(regexes)))
+
+
+def _match_index(pattern: Pattern[str], text: str) -> Optional[int]:
+    """Index of the first regex of an ``_alternation`` that matches text."""
+    m = pattern.match(text)
+    if m is None or m.lastgroup is None:
+        return None
+    return int(m.lastgroup[len(_ALT_GROUP) :])
+
+
+def _has_wildcard(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
 
 class LanguageRegistry:
     """
@@ -26,17 +48,32 @@ class LanguageRegistry:
         self._by_language: Dict[Language, LanguageSpec] = {}
         self._by_extension: Dict[str, Language] = {}
         self._by_filename: Dict[str, Language] = {}
-        self._shebang_languages: List[LanguageSpec] = []
+        self._shebangs: List[Tuple[str, Language]] = []  # (prefix, Language)
+        self._shebang_re: Optional[Pattern[str]] = None  # one named group per _shebangs entry
         self._glob_patterns: List[Tuple[str, Language]] = []  # (pattern, Language)
+        self._glob_re: Optional[Pattern[str]] = None  # one named group per _glob_patterns entry
+        # Names a wildcard pattern might claim, so an extension hit must not
+        # short-circuit them: literal heads of "x*" / tails of "*x" patterns,
+        # or every name if some pattern has any other shape.
+        self._glob_prefixes: Tuple[str, ...] = ()
+        self._glob_suffixes: Tuple[str, ...] = ()
+        self._glob_any_shape = False
+        self._file_globs: List[str] = []
 
         self._build_indexes()
 
     def _build_indexes(self) -> None:
         """Build lookup indexes from specs."""
+        seen: set = set()
         for spec in self._specs:
             self._by_language[spec.language] = spec
 
             for glob in spec.file_globs:
+                # stable dedupe (preserve order) for get_supported_file_globs
+                if glob not in seen:
+                    self._file_globs.append(glob)
+                    seen.add(glob)
+
                 g = glob.lower()
 
                 # Exact filename (no wildcard)
@@ -63,7 +100,27 @@ class LanguageRegistry:
                         self._by_filename[p] = spec.language
 
             if spec.detect_by_shebang:
-                self._shebang_languages.append(spec)
+                for shebang in spec.shebang_patterns:
+                    self._shebangs.append((shebang, spec.language))
+
+        # Fold the wildcard patterns into one alternation; the first group
+        # that matches is the first pattern fnmatch would have matched.
+        if self._glob_patterns:
+            self._glob_re = _alternation(translate(p) for p, _ in self._glob_patterns)
+        prefixes: List[str] = []
+        suffixes: List[str] = []
+        for p, _ in self._glob_patterns:
+            if p.startswith("*") and not _has_wildcard(p[1:]):
+                suffixes.append(p[1:])
+            elif p.endswith("*") and not _has_wildcard(p[:-1]):
+                prefixes.append(p[:-1])
+            else:
+                self._glob_any_shape = True
+        self._glob_prefixes = tuple(dict.fromkeys(prefixes))
+        self._glob_suffixes = tuple(dict.fromkeys(suffixes))
+        # Same for shebang prefixes, so a first line is classified in one match.
+        if self._shebangs:
+            self._shebang_re = _alternation(re.escape(prefix) for prefix, _ in self._shebangs)
 
     def get_spec(self, language: Language) -> Optional[LanguageSpec]:
         """Get spec for a language."""
@@ -75,30 +132,46 @@ class LanguageRegistry:
 
         Detection order:
         1. Exact filename match (Dockerfile, Makefile, etc.)
-        2. Extension match
-        3. Shebang detection (if content provided)
+        2. Wildcard filename match (Dockerfile.*, *.tf.json, etc.)
+        3. Extension match
+        4. Shebang detection (if content provided)
+
+        Most files are settled by their extension alone, so that is looked up
+        first and returned without trying the wildcards whenever none of them
+        could match the name.
         """
         filename = file_path.name.lower()
-        suffix = file_path.suffix.lower()
 
         if filename in self._by_filename:
             return self._by_filename[filename]
 
-        # Wildcards (Dockerfile.*, *.Dockerfile, *.tf.json, etc.)
-        for pattern, lang in self._glob_patterns:
-            if fnmatch(filename, pattern):
-                return lang
-
-        if suffix in self._by_extension:
-            return self._by_extension[suffix]
-
-        if content and self._shebang_languages:
-            first_line = content.split("\n", 1)[0].strip()
+        # Same as Path.suffix, without re-deriving the name.
+        dot = filename.rfind(".")
+        suffix = filename[dot:] if 0 < dot < len(filename) - 1 else ""
+        by_extension = self._by_extension.get(suffix)
+        if by_extension is not None and not (
+            self._glob_any_shape
+            or filename.startswith(self._glob_prefixes)
+            or filename.endswith(self._glob_suffixes)
+        ):
+            return by_extension
+
+        if self._glob_re is not None:
+            index = _match_index(self._glob_re, filename)
+            if index is not None:
+                return self._glob_patterns[index][1]
+
+        if by_extension is not None:
+            return by_extension
+
+        if content and self._shebang_re is not None:
+            # Only the first line matters; don't split (and copy) the whole file.
+            end = content.find("\n")
+            first_line = (content if end < 0 else content[:end]).strip()
             if first_line.startswith("#!"):
-                for spec in self._shebang_languages:
-                    for shebang in spec.shebang_patterns:
-                        if first_line.startswith(shebang):
-                            return spec.language
+                index = _match_index(self._shebang_re, first_line)
+                if index is not None:
+                    return self._shebangs[index][1]
 
         return Language.UNKNOWN
 
@@ -116,18 +189,7 @@ class LanguageRegistry:
 
     def get_supported_file_globs(self) -> List[str]:
         """Return all file globs across specs (for file discovery)."""
-        globs: List[str] = []
-        for spec in self._specs:
-            globs.extend(spec.file_globs)
-
-        # stable dedupe (preserve order)
-        seen: set = set()
-        out: List[str] = []
-        for g in globs:
-            if g not in seen:
-                out.append(g)
-                seen.add(g)
-        return out
+        return list(self._file_globs)
 
     def resolve_providers(
         self,
@@ -176,14 +238,13 @@ class LanguageRegistry:
         return list(spec.internal_analyzers) if spec else []
 
 
-_default_registry: Optional[LanguageRegistry] = None
+# Built at import (well under a millisecond) so get_registry() needs no
+# check-then-create, which could race and build two registries.
+_default_registry = LanguageRegistry()
 
 
 def get_registry() -> LanguageRegistry:
     """Get the default language registry (singleton)."""
-    global _default_registry
-    if _default_registry is None:
-        _default_registry = LanguageRegistry()
     return _default_registry
 
 
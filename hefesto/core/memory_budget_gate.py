@@ -11,9 +11,13 @@ Key design:
   normalization (macOS reports bytes, Linux reports KB).
 - Pure-Python, no new dependencies.
 - Deterministic: never flaky — controlled by injectable provider.
+- ``ru_maxrss`` is a high-water mark, so a run that stays under an earlier
+  peak reports no delta.  With tracing on, the ``tracemalloc`` peak of the
+  run itself is recorded as well and also checked against the threshold.
 
 Environment:
   HEFESTO_MEMORY_BUDGET_THRESHOLD_KB  (default: 50000 ≈ 50 MB)
+  HEFESTO_MEMORY_BUDGET_TRACE         (``1`` to record the tracemalloc peak)
 
 Copyright 2025 Narapa LLC, Miami, Florida
 """
@@ -21,6 +25,7 @@ Copyright 2025 Narapa LLC, Miami, Florida
 import os
 import platform
 import resource
+import tracemalloc
 from dataclasses import asdict, dataclass
 from typing import Any, Callable, Dict, Optional, Protocol, Tuple, TypeVar
 
@@ -69,6 +74,10 @@ class MemoryBudgetResult:
     threshold_kb: int
     passed: bool
     message: str
+    traced_peak_kb: Optional[int] = None
+    # Peak of a tracemalloc session that was already running before measure()
+    # (which measure() had to reset); None when the gate started tracing itself.
+    prior_traced_peak_kb: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -94,27 +103,61 @@ class MemoryBudgetGate:
         self,
         threshold_kb: Optional[int] = None,
         rss_provider: Optional["RSSProvider"] = None,
+        trace: Optional[bool] = None,
     ):
         self.threshold_kb = threshold_kb or int(
             os.environ.get("HEFESTO_MEMORY_BUDGET_THRESHOLD_KB", "50000")
         )
         self._rss: RSSProvider = rss_provider or DefaultRSSProvider()
+        if trace is None:
+            trace = os.environ.get("HEFESTO_MEMORY_BUDGET_TRACE") == "1"
+        self.trace = trace
 
     def measure(self, fn: Callable[[], T]) -> Tuple[T, MemoryBudgetResult]:
         """Execute *fn* and measure RSS delta.
 
+        With tracing enabled, also records the peak Python heap allocated
+        while *fn* runs, above what was allocated before it; the larger of
+        that and the RSS delta is checked against the threshold.
+
+        If ``tracemalloc`` is already running, its peak has to be reset to
+        measure *fn*.  The caller's peak is lost from ``tracemalloc`` as a
+        result, so it is reported as ``prior_traced_peak_kb`` instead.
+
         Returns ``(fn_result, MemoryBudgetResult)``.
         """
+        traced_peak_kb: Optional[int] = None
+        prior_traced_peak_kb: Optional[int] = None
+        started_tracing = False
+        if self.trace:
+            if tracemalloc.is_tracing():
+                prior_traced_peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+            else:
+                tracemalloc.start()
+                started_tracing = True
+
         before = self._rss.get_rss_kb()
-        result = fn()
+        try:
+            if self.trace:
+                tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+            result = fn()
+            if self.trace:
+                traced_peak_kb = (tracemalloc.get_traced_memory()[1] - traced_before) // 1024
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
         after = self._rss.get_rss_kb()
         delta = after - before
 
-        passed = delta <= self.threshold_kb
+        measured = f"delta {delta} KB"
+        if traced_peak_kb is not None:
+            measured += f", traced peak {traced_peak_kb} KB"
+        passed = max(delta, traced_peak_kb or 0) <= self.threshold_kb
         if passed:
-            message = f"Memory budget OK: delta {delta} KB <= threshold {self.threshold_kb} KB"
+            message = f"Memory budget OK: {measured} <= threshold {self.threshold_kb} KB"
         else:
-            message = f"Memory budget EXCEEDED: delta {delta} KB > threshold {self.threshold_kb} KB"
+            message = f"Memory budget EXCEEDED: {measured} > threshold {self.threshold_kb} KB"
 
         budget_result = MemoryBudgetResult(
             rss_before_kb=before,
@@ -123,6 +166,8 @@ class MemoryBudgetGate:
             threshold_kb=self.threshold_kb,
             passed=passed,
             message=message,
+            traced_peak_kb=traced_peak_kb,
+            prior_traced_peak_kb=prior_traced_peak_kb,
         )
         return result, budget_result
 
@@ -1,10 +1,16 @@
 """Factory for creating appropriate parser for each language."""
 
+import threading
+
 from hefesto.core.language_detector import Language
 from hefesto.core.parsers.base_parser import CodeParser
 from hefesto.core.parsers.python_parser import PythonParser
 from hefesto.core.parsers.treesitter_parser import TreeSitterParser
 
+# Parsers are reused across files and engines, but a tree-sitter Parser is not
+# thread-safe, so each thread keeps its own.
+_local = threading.local()
+
 
 class ParserFactory:
     """Factory for creating appropriate parser for each language."""
@@ -21,7 +27,18 @@ class ParserFactory:
 
     @staticmethod
     def get_parser(language: Language) -> CodeParser:
-        """Get parser for language."""
+        """Get parser for language, built once per thread."""
+        cache = getattr(_local, "parsers", None)
+        if cache is None:
+            cache = _local.parsers = {}
+        parser = cache.get(language)
+        if parser is None:
+            parser = cache[language] = ParserFactory._create_parser(language)
+        return parser
+
+    @staticmethod
+    def _create_parser(language: Language) -> CodeParser:
+        """Construct a new parser for language."""
         if language == Language.PYTHON:
             return PythonParser()
         elif language in ParserFactory.GRAMMAR_NAMES:
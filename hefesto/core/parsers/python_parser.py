@@ -1,11 +1,31 @@
 """Python parser using built-in ast module."""
 
 import ast
-from typing import List
+from itertools import accumulate
+from typing import List, Tuple
 
 from hefesto.core.ast.generic_ast import GenericAST, GenericNode, NodeType
 from hefesto.core.parsers.base_parser import CodeParser
 
+# Python AST node class -> NodeType; anything else maps to UNKNOWN.
+_TYPE_MAP = {
+    ast.FunctionDef: NodeType.FUNCTION,
+    ast.AsyncFunctionDef: NodeType.ASYNC_FUNCTION,
+    ast.ClassDef: NodeType.CLASS,
+    ast.If: NodeType.CONDITIONAL,
+    ast.For: NodeType.LOOP,
+    ast.While: NodeType.LOOP,
+    ast.AsyncFor: NodeType.LOOP,
+    ast.Call: NodeType.CALL,
+    ast.Return: NodeType.RETURN,
+    ast.Import: NodeType.IMPORT,
+    ast.ImportFrom: NodeType.IMPORT,
+    ast.Try: NodeType.TRY,
+    ast.Raise: NodeType.THROW,
+    ast.Assign: NodeType.VARIABLE,
+    ast.AnnAssign: NodeType.VARIABLE,
+}
+
 
 class PythonParser(CodeParser):
     """Python parser using built-in ast module."""
@@ -14,17 +34,18 @@ class PythonParser(CodeParser):
         """Parse Python code using ast module."""
         try:
             tree = ast.parse(code, filename=file_path)
-            # Pre-compute lines once for O(1) text extraction per node
-            # (MiniMax Option B: avoids O(n) split per node)
-            lines = code.split("\n")
-            root = self._convert_ast_to_generic(tree, lines)
+            # ast columns are UTF-8 byte offsets; pre-compute the byte offset
+            # of each line so node text can be sliced lazily from the bytes.
+            data = code.encode("utf-8")
+            line_starts = list(accumulate((len(line) + 1 for line in data.split(b"\n")), initial=0))
+            root = self._convert_ast_to_generic(tree, data, line_starts)
             return GenericAST(root, "python", code)
         except SyntaxError as e:
             root = GenericNode(
                 type=NodeType.UNKNOWN,
                 name=None,
                 line_start=1,
-                line_end=len(code.split("\n")),
+                line_end=code.count("\n") + 1,
                 column_start=0,
                 column_end=0,
                 text=code,
@@ -36,78 +57,53 @@ class PythonParser(CodeParser):
     def supports_language(self, language: str) -> bool:
         return language == "python"
 
-    def _extract_node_text(self, node: ast.AST, lines: List[str]) -> str:
-        """Extract source text for an AST node using pre-computed lines.
-
-        Uses lineno/end_lineno (1-based) and col_offset/end_col_offset (0-based)
-        to slice the original source. Returns empty string for nodes without
-        position info (e.g. Module root).
+    def _convert_ast_to_generic(
+        self, tree: ast.AST, data: bytes, line_starts: List[int]
+    ) -> GenericNode:
+        """Convert Python AST to GenericNode.
 
-        Design: DeepSeek (architecture) + MiniMax (pre-computed lines optimization).
+        Iterative walk with an explicit stack, so deeply nested expressions
+        cannot hit the recursion limit. Each node's children are converted
+        together, which keeps them in source order.
+        """
+        root = self._convert_node(tree, data, line_starts)
+        stack: List[Tuple[ast.AST, GenericNode]] = [(tree, root)]
+        while stack:
+            node, gnode = stack.pop()
+            for child in ast.iter_child_nodes(node):
+                gchild = self._convert_node(child, data, line_starts)
+                gnode.children.append(gchild)
+                stack.append((child, gchild))
+        return root
+
+    def _convert_node(self, node: ast.AST, data: bytes, line_starts: List[int]) -> GenericNode:
+        """Convert a single Python AST node, without its children.
+
+        ``text`` is left to be sliced from ``data`` on first read; nodes
+        without position info (e.g. the Module root) get an empty span.
         """
+        start = end = 0
         lineno = getattr(node, "lineno", None)
         end_lineno = getattr(node, "end_lineno", None)
-        if lineno is None or end_lineno is None:
-            return ""
-
-        col_offset: int = getattr(node, "col_offset", 0)
-        end_col_offset: int = getattr(node, "end_col_offset", 0)
-
-        start_idx = lineno - 1
-        end_idx = end_lineno - 1
-
-        if start_idx < 0 or end_idx >= len(lines):
-            return ""
-
-        if start_idx == end_idx:
-            return str(lines[start_idx][col_offset:end_col_offset])
-
-        parts: list[str] = [lines[start_idx][col_offset:]]
-        if end_idx > start_idx + 1:
-            parts.extend(lines[start_idx + 1 : end_idx])
-        parts.append(lines[end_idx][:end_col_offset])
-        return "\n".join(parts)
-
-    def _convert_ast_to_generic(self, node: ast.AST, lines: List[str]) -> GenericNode:
-        """Convert Python AST to GenericNode."""
-        node_type = self._map_node_type(node)
-        name = getattr(node, "name", None)
+        if lineno is not None and end_lineno is not None:
+            if lineno >= 1 and end_lineno < len(line_starts):
+                start = line_starts[lineno - 1] + getattr(node, "col_offset", 0)
+                end = line_starts[end_lineno - 1] + getattr(node, "end_col_offset", 0)
         line_start = getattr(node, "lineno", 1)
-        line_end = getattr(node, "end_lineno", line_start)
-
-        children = []
-        for child in ast.iter_child_nodes(node):
-            children.append(self._convert_ast_to_generic(child, lines))
-
         return GenericNode(
-            type=node_type,
-            name=name,
+            type=self._map_node_type(node),
+            name=getattr(node, "name", None),
             line_start=line_start,
-            line_end=line_end,
+            line_end=getattr(node, "end_lineno", line_start),
             column_start=getattr(node, "col_offset", 0),
             column_end=getattr(node, "end_col_offset", 0),
-            text=self._extract_node_text(node, lines),
-            children=children,
+            children=[],
             metadata={"python_node_type": type(node).__name__},
+            source=data,
+            start_offset=start,
+            end_offset=end,
         )
 
     def _map_node_type(self, node: ast.AST) -> NodeType:
         """Map Python AST node to NodeType."""
-        mapping = {
-            ast.FunctionDef: NodeType.FUNCTION,
-            ast.AsyncFunctionDef: NodeType.ASYNC_FUNCTION,
-            ast.ClassDef: NodeType.CLASS,
-            ast.If: NodeType.CONDITIONAL,
-            ast.For: NodeType.LOOP,
-            ast.While: NodeType.LOOP,
-            ast.AsyncFor: NodeType.LOOP,
-            ast.Call: NodeType.CALL,
-            ast.Return: NodeType.RETURN,
-            ast.Import: NodeType.IMPORT,
-            ast.ImportFrom: NodeType.IMPORT,
-            ast.Try: NodeType.TRY,
-            ast.Raise: NodeType.THROW,
-            ast.Assign: NodeType.VARIABLE,
-            ast.AnnAssign: NodeType.VARIABLE,
-        }
-        return mapping.get(type(node), NodeType.UNKNOWN)
+        return _TYPE_MAP.get(type(node), NodeType.UNKNOWN)
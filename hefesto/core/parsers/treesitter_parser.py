@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 from hefesto.core.ast.generic_ast import GenericAST, GenericNode, NodeType
 from hefesto.core.parsers.base_parser import CodeParser
@@ -28,6 +28,108 @@ except ImportError:
 if not USE_PREBUILT:
     from tree_sitter import Language, Parser
 
+# Grammar name -> loaded tree_sitter.Language for the manual-build path, so
+# parsers share one load of languages.so per grammar.
+_LANGUAGES: dict = {}
+
+
+# TreeSitter node type -> NodeType, per grammar; unknown types map to UNKNOWN.
+_JS_TS_NODE_TYPES = {
+    "function_declaration": NodeType.FUNCTION,
+    "arrow_function": NodeType.FUNCTION,
+    "function": NodeType.FUNCTION,
+    "function_expression": NodeType.FUNCTION,
+    "method_definition": NodeType.METHOD,
+    "class_declaration": NodeType.CLASS,
+    "if_statement": NodeType.CONDITIONAL,
+    "switch_statement": NodeType.CONDITIONAL,
+    "ternary_expression": NodeType.CONDITIONAL,
+    "conditional_expression": NodeType.CONDITIONAL,
+    "for_statement": NodeType.LOOP,
+    "for_in_statement": NodeType.LOOP,
+    "while_statement": NodeType.LOOP,
+    "do_statement": NodeType.LOOP,
+    "call_expression": NodeType.CALL,
+    "return_statement": NodeType.RETURN,
+    "import_statement": NodeType.IMPORT,
+    "variable_declaration": NodeType.VARIABLE,
+    "lexical_declaration": NodeType.VARIABLE,
+    "try_statement": NodeType.TRY,
+    "catch_clause": NodeType.CATCH,
+    "throw_statement": NodeType.THROW,
+}
+
+_JAVA_NODE_TYPES = {
+    "method_declaration": NodeType.METHOD,
+    "class_declaration": NodeType.CLASS,
+    "if_statement": NodeType.CONDITIONAL,
+    "switch_expression": NodeType.CONDITIONAL,
+    "for_statement": NodeType.LOOP,
+    "enhanced_for_statement": NodeType.LOOP,
+    "while_statement": NodeType.LOOP,
+    "do_statement": NodeType.LOOP,
+    "method_invocation": NodeType.CALL,
+    "return_statement": NodeType.RETURN,
+    "import_declaration": NodeType.IMPORT,
+    "try_statement": NodeType.TRY,
+    "catch_clause": NodeType.CATCH,
+    "throw_statement": NodeType.THROW,
+}
+
+_GO_NODE_TYPES = {
+    "function_declaration": NodeType.FUNCTION,
+    "method_declaration": NodeType.METHOD,
+    "type_declaration": NodeType.CLASS,
+    "if_statement": NodeType.CONDITIONAL,
+    "switch_statement": NodeType.CONDITIONAL,
+    "for_statement": NodeType.LOOP,
+    "call_expression": NodeType.CALL,
+    "return_statement": NodeType.RETURN,
+    "import_declaration": NodeType.IMPORT,
+}
+
+_RUST_NODE_TYPES = {
+    "function_item": NodeType.FUNCTION,
+    "impl_item": NodeType.CLASS,
+    "struct_item": NodeType.CLASS,
+    "enum_item": NodeType.CLASS,
+    "if_expression": NodeType.CONDITIONAL,
+    "match_expression": NodeType.CONDITIONAL,
+    "for_expression": NodeType.LOOP,
+    "while_expression": NodeType.LOOP,
+    "loop_expression": NodeType.LOOP,
+    "call_expression": NodeType.CALL,
+    "return_expression": NodeType.RETURN,
+    "use_declaration": NodeType.IMPORT,
+}
+
+_CSHARP_NODE_TYPES = {
+    "method_declaration": NodeType.METHOD,
+    "class_declaration": NodeType.CLASS,
+    "struct_declaration": NodeType.CLASS,
+    "if_statement": NodeType.CONDITIONAL,
+    "switch_statement": NodeType.CONDITIONAL,
+    "for_statement": NodeType.LOOP,
+    "foreach_statement": NodeType.LOOP,
+    "while_statement": NodeType.LOOP,
+    "do_statement": NodeType.LOOP,
+    "invocation_expression": NodeType.CALL,
+    "return_statement": NodeType.RETURN,
+    "using_directive": NodeType.IMPORT,
+    "try_statement": NodeType.TRY,
+    "catch_clause": NodeType.CATCH,
+    "throw_statement": NodeType.THROW,
+}
+
+_NODE_TYPES_BY_LANGUAGE = {
+    "typescript": _JS_TS_NODE_TYPES,
+    "javascript": _JS_TS_NODE_TYPES,
+    "java": _JAVA_NODE_TYPES,
+    "go": _GO_NODE_TYPES,
+    "rust": _RUST_NODE_TYPES,
+    "c_sharp": _CSHARP_NODE_TYPES,
+}
+
 
 class TreeSitterParser(CodeParser):
     """Universal parser using TreeSitter."""
@@ -44,6 +146,7 @@ class TreeSitterParser(CodeParser):
 
     def __init__(self, language: str):
         self.language = language
+        self._node_types = _NODE_TYPES_BY_LANGUAGE.get(language, {})
 
         if USE_PREBUILT:
             ts_lang = self.LANG_MAP.get(language, language)
@@ -61,154 +164,90 @@ class TreeSitterParser(CodeParser):
                 "c_sharp": "c_sharp",
             }
             grammar_name = grammar_map.get(language, language)
-            self.language = Language(str(build_path), grammar_name)  # type: ignore
+            ts_language = _LANGUAGES.get(grammar_name)
+            if ts_language is None:
+                ts_language = Language(str(build_path), grammar_name)  # type: ignore
+                _LANGUAGES[grammar_name] = ts_language
+            self.language = ts_language
             self.parser.set_language(self.language)
 
     def parse(self, code: str, file_path: str) -> GenericAST:
         """Parse code using TreeSitter."""
-        tree = self.parser.parse(bytes(code, "utf8"))
-        root = self._convert_treesitter_to_generic(tree.root_node, code, parent=None)
+        data = code.encode("utf-8")
+        tree = self.parser.parse(data)
+        root = self._convert_tree(tree.walk(), data)
         return GenericAST(root, self.language, code)
 
     def supports_language(self, language: str) -> bool:
         return language in self.LANG_MAP
 
-    def _convert_treesitter_to_generic(self, node, source: str, parent=None) -> GenericNode:
-        """Convert TreeSitter node to GenericNode."""
-        node_type = self._map_node_type(node.type, self.language)
-
-        children = []
-        for child in node.children:
-            children.append(self._convert_treesitter_to_generic(child, source, parent=node))
+    def _convert_tree(self, cursor, data: bytes) -> GenericNode:
+        """Convert a TreeSitter tree to GenericNode by walking ``cursor``.
 
+        Pre-order walk with the tree cursor (no Python recursion); ``stack``
+        holds the (TreeSitter, Generic) ancestors of the cursor's node, and
+        each node is appended to its parent as it is reached, which keeps
+        children in source order.
+        """
+        root = self._convert_node(cursor.node, data, None)
+        stack: List[Tuple[Any, GenericNode]] = [(cursor.node, root)]
+        if not cursor.goto_first_child():
+            return root
+        while True:
+            node = cursor.node
+            parent, gparent = stack[-1]
+            gnode = self._convert_node(node, data, parent)
+            gparent.children.append(gnode)
+
+            if cursor.goto_first_child():
+                stack.append((node, gnode))
+                continue
+            # Leaf: move to the next sibling, climbing out of finished subtrees.
+            while not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                stack.pop()
+                if not stack:
+                    return root
+
+    def _convert_node(self, node, data: bytes, parent=None) -> GenericNode:
+        """Convert a single TreeSitter node, without its children.
+
+        ``text`` is sliced lazily from ``data`` by the node's byte span.
+        """
         # Extract name with parent context for arrow functions
-        name = self._extract_name(node, source, parent)
+        name = self._extract_name(node, data, parent)
 
         # Extract parameter count for functions
-        param_count = self._extract_parameter_count(node, source)
+        param_count = self._extract_parameter_count(node)
 
         return GenericNode(
-            type=node_type,
+            type=self._map_node_type(node.type),
             name=name,
             line_start=node.start_point[0] + 1,
             line_end=node.end_point[0] + 1,
             column_start=node.start_point[1],
             column_end=node.end_point[1],
-            text=(
-                source[node.start_byte : node.end_byte]
-                if node.start_byte < len(source.encode("utf8"))
-                else ""
-            ),
-            children=children,
+            children=[],
             metadata={
                 "treesitter_type": node.type,
                 "language": self.language,
                 "param_count": param_count,
             },
+            source=data,
+            start_offset=node.start_byte,
+            end_offset=node.end_byte,
         )
 
-    def _map_node_type(self, ts_type: str, language: str) -> NodeType:
+    def _map_node_type(self, ts_type: str) -> NodeType:
         """Map TreeSitter node type to NodeType."""
-        if language in ["typescript", "javascript"]:
-            mapping = {
-                "function_declaration": NodeType.FUNCTION,
-                "arrow_function": NodeType.FUNCTION,
-                "function": NodeType.FUNCTION,
-                "function_expression": NodeType.FUNCTION,
-                "method_definition": NodeType.METHOD,
-                "class_declaration": NodeType.CLASS,
-                "if_statement": NodeType.CONDITIONAL,
-                "switch_statement": NodeType.CONDITIONAL,
-                "ternary_expression": NodeType.CONDITIONAL,
-                "conditional_expression": NodeType.CONDITIONAL,
-                "for_statement": NodeType.LOOP,
-                "for_in_statement": NodeType.LOOP,
-                "while_statement": NodeType.LOOP,
-                "do_statement": NodeType.LOOP,
-                "call_expression": NodeType.CALL,
-                "return_statement": NodeType.RETURN,
-                "import_statement": NodeType.IMPORT,
-                "variable_declaration": NodeType.VARIABLE,
-                "lexical_declaration": NodeType.VARIABLE,
-                "try_statement": NodeType.TRY,
-                "catch_clause": NodeType.CATCH,
-                "throw_statement": NodeType.THROW,
-            }
-            return mapping.get(ts_type, NodeType.UNKNOWN)
-
-        elif language == "java":
-            mapping = {
-                "method_declaration": NodeType.METHOD,
-                "class_declaration": NodeType.CLASS,
-                "if_statement": NodeType.CONDITIONAL,
-                "switch_expression": NodeType.CONDITIONAL,
-                "for_statement": NodeType.LOOP,
-                "enhanced_for_statement": NodeType.LOOP,
-                "while_statement": NodeType.LOOP,
-                "do_statement": NodeType.LOOP,
-                "method_invocation": NodeType.CALL,
-                "return_statement": NodeType.RETURN,
-                "import_declaration": NodeType.IMPORT,
-                "try_statement": NodeType.TRY,
-                "catch_clause": NodeType.CATCH,
-                "throw_statement": NodeType.THROW,
-            }
-            return mapping.get(ts_type, NodeType.UNKNOWN)
-
-        elif language == "go":
-            mapping = {
-                "function_declaration": NodeType.FUNCTION,
-                "method_declaration": NodeType.METHOD,
-                "type_declaration": NodeType.CLASS,
-                "if_statement": NodeType.CONDITIONAL,
-                "switch_statement": NodeType.CONDITIONAL,
-                "for_statement": NodeType.LOOP,
-                "call_expression": NodeType.CALL,
-                "return_statement": NodeType.RETURN,
-                "import_declaration": NodeType.IMPORT,
-            }
-            return mapping.get(ts_type, NodeType.UNKNOWN)
-
-        elif language == "rust":
-            mapping = {
-                "function_item": NodeType.FUNCTION,
-                "impl_item": NodeType.CLASS,
-                "struct_item": NodeType.CLASS,
-                "enum_item": NodeType.CLASS,
-                "if_expression": NodeType.CONDITIONAL,
-                "match_expression": NodeType.CONDITIONAL,
-                "for_expression": NodeType.LOOP,
-                "while_expression": NodeType.LOOP,
-                "loop_expression": NodeType.LOOP,
-                "call_expression": NodeType.CALL,
-                "return_expression": NodeType.RETURN,
-                "use_declaration": NodeType.IMPORT,
-            }
-            return mapping.get(ts_type, NodeType.UNKNOWN)
-
-        elif language == "c_sharp":
-            mapping = {
-                "method_declaration": NodeType.METHOD,
-                "class_declaration": NodeType.CLASS,
-                "struct_declaration": NodeType.CLASS,
-                "if_statement": NodeType.CONDITIONAL,
-                "switch_statement": NodeType.CONDITIONAL,
-                "for_statement": NodeType.LOOP,
-                "foreach_statement": NodeType.LOOP,
-                "while_statement": NodeType.LOOP,
-                "do_statement": NodeType.LOOP,
-                "invocation_expression": NodeType.CALL,
-                "return_statement": NodeType.RETURN,
-                "using_directive": NodeType.IMPORT,
-                "try_statement": NodeType.TRY,
-                "catch_clause": NodeType.CATCH,
-                "throw_statement": NodeType.THROW,
-            }
-            return mapping.get(ts_type, NodeType.UNKNOWN)
+        return self._node_types.get(ts_type, NodeType.UNKNOWN)
 
-        return NodeType.UNKNOWN
+    @staticmethod
+    def _node_source(node, data: bytes) -> str:
+        """Source text of ``node``; tree-sitter offsets index the UTF-8 bytes."""
+        return data[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
 
-    def _extract_name(self, node, source: str, parent=None) -> Optional[str]:
+    def _extract_name(self, node, data: bytes, parent=None) -> Optional[str]:
         """
         Extract name from node with smart inference for arrow functions.
 
@@ -222,7 +261,7 @@ class TreeSitterParser(CodeParser):
         # 1. Direct identifier child (standard function declaration)
         for child in node.children:
             if child.type == "identifier":
-                return source[child.start_byte : child.end_byte]
+                return self._node_source(child, data)
 
         # 2. For arrow functions, look at parent context
         if node.type in ["arrow_function", "function_expression", "function"]:
@@ -231,7 +270,7 @@ class TreeSitterParser(CodeParser):
                 if parent.type == "variable_declarator":
                     for child in parent.children:
                         if child.type == "identifier":
-                            return source[child.start_byte : child.end_byte]
+                            return self._node_source(child, data)
 
                 # Check if parent is pair/property: { NAME: () => {} }
                 if parent.type in ["pair", "property", "property_assignment"]:
@@ -241,7 +280,7 @@ class TreeSitterParser(CodeParser):
                             "identifier",
                             "string",
                         ]:
-                            name = source[child.start_byte : child.end_byte]
+                            name = self._node_source(child, data)
                             # Remove quotes from string keys
                             return name.strip("'\"")
 
@@ -249,13 +288,13 @@ class TreeSitterParser(CodeParser):
                 if parent.type == "assignment_expression":
                     for child in parent.children:
                         if child.type == "identifier":
-                            return source[child.start_byte : child.end_byte]
+                            return self._node_source(child, data)
 
         # 3. Method definition name
         if node.type == "method_definition":
             for child in node.children:
                 if child.type == "property_identifier":
-                    return source[child.start_byte : child.end_byte]
+                    return self._node_source(child, data)
 
         # 4. Return '<anonymous>' instead of None for unnamed functions
         if node.type in [
@@ -269,7 +308,7 @@ class TreeSitterParser(CodeParser):
 
         return None
 
-    def _extract_parameter_count(self, node, source: str) -> int:
+    def _extract_parameter_count(self, node) -> int:
         """
         Extract the actual parameter count from formal_parameters.
 
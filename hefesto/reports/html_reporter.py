@@ -6,7 +6,7 @@ Generates interactive HTML reports with basic styling.
 Copyright © 2025 Narapa LLC, Miami, Florida
 """
 
-from typing import List
+from typing import Iterator, List, TextIO
 
 from hefesto.core.analysis_models import (
     AnalysisIssue,
@@ -28,53 +28,48 @@ class HTMLReporter:
         Returns:
             HTML string
         """
-        html_parts = []
+        return "".join(self._iter_chunks(report))
 
-        # HTML header
-        html_parts.append(self._generate_header())
+    def stream(self, report: AnalysisReport, fileobj: TextIO) -> None:
+        """
+        Write HTML report to a file object as it is rendered.
 
-        # Summary section
-        html_parts.append(self._generate_summary(report))
+        Produces the same document as ``generate`` without materializing
+        the full string, so peak memory is one issue card rather than the
+        whole report.
 
-        # Issues by severity
-        all_issues = report.get_all_issues()
-
-        if report.summary.critical_issues > 0:
-            html_parts.append(
-                self._generate_issues_section(
-                    AnalysisIssueSeverity.CRITICAL,
-                    [i for i in all_issues if i.severity == AnalysisIssueSeverity.CRITICAL],
-                )
-            )
-
-        if report.summary.high_issues > 0:
-            html_parts.append(
-                self._generate_issues_section(
-                    AnalysisIssueSeverity.HIGH,
-                    [i for i in all_issues if i.severity == AnalysisIssueSeverity.HIGH],
-                )
-            )
+        Args:
+            report: AnalysisReport to format
+            fileobj: Text file object opened for writing
+        """
+        for chunk in self._iter_chunks(report):
+            fileobj.write(chunk)
 
-        if report.summary.medium_issues > 0:
-            html_parts.append(
-                self._generate_issues_section(
-                    AnalysisIssueSeverity.MEDIUM,
-                    [i for i in all_issues if i.severity == AnalysisIssueSeverity.MEDIUM],
-                )
-            )
+    def _iter_chunks(self, report: AnalysisReport) -> Iterator[str]:
+        """Yield the HTML document in order, section by section."""
+        yield self._generate_header()
+        yield "\n"
+        yield self._generate_summary(report)
 
-        if report.summary.low_issues > 0:
-            html_parts.append(
-                self._generate_issues_section(
-                    AnalysisIssueSeverity.LOW,
-                    [i for i in all_issues if i.severity == AnalysisIssueSeverity.LOW],
+        # Issues by severity
+        all_issues = report.get_all_issues()
+        summary = report.summary
+        sections = (
+            (AnalysisIssueSeverity.CRITICAL, summary.critical_issues),
+            (AnalysisIssueSeverity.HIGH, summary.high_issues),
+            (AnalysisIssueSeverity.MEDIUM, summary.medium_issues),
+            (AnalysisIssueSeverity.LOW, summary.low_issues),
+        )
+        for severity, count in sections:
+            if count > 0:
+                yield "\n"
+                yield from self._iter_issues_section(
+                    severity, [i for i in all_issues if i.severity == severity]
                 )
-            )
 
         # Footer
-        html_parts.append(self._generate_footer(report))
-
-        return "\n".join(html_parts)
+        yield "\n"
+        yield self._generate_footer(report)
 
     def _generate_header(self) -> str:
         """Generate HTML header with CSS."""
@@ -234,18 +229,18 @@ class HTMLReporter:
         </div>
 """
 
-    def _generate_issues_section(
+    def _iter_issues_section(
         self, severity: AnalysisIssueSeverity, issues: List[AnalysisIssue]
-    ) -> str:
-        """Generate section for issues of a specific severity."""
+    ) -> Iterator[str]:
+        """Yield the section for one severity, one issue card at a time."""
         if not issues:
-            return ""
+            return
 
         icon = {"CRITICAL": "🔥", "HIGH": "❌", "MEDIUM": "⚠️", "LOW": "💡"}.get(
             severity.value, "•"
         )
 
-        html = f"""
+        yield f"""
         <div class="severity-section">
             <div class="severity-header severity-{severity.value}">
                 {icon} {severity.value} Issues ({len(issues)})
@@ -253,10 +248,9 @@ class HTMLReporter:
 """
 
         for issue in issues:
-            html += self._generate_issue_card(issue)
+            yield self._generate_issue_card(issue)
 
-        html += "        </div>\n"
-        return html
+        yield "        </div>\n"
 
     def _generate_issue_card(self, issue: AnalysisIssue) -> str:
         """Generate HTML for a single issue."""
@@ -4,8 +4,6 @@ import hashlib
 import json
 import os
 import time
-import urllib.request
-import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -254,6 +252,8 @@ def _get_session_id() -> str:
             sid = _SESSION_ID_FILE.read_text(encoding="utf-8").strip()
             if sid:
                 return sid
+        import uuid
+
         sid = uuid.uuid4().hex[:12]
         _SESSION_ID_FILE.parent.mkdir(parents=True, exist_ok=True)
         _SESSION_ID_FILE.write_text(sid, encoding="utf-8")
@@ -303,12 +303,12 @@ def _get_install_source() -> str:
         return "unknown"
 
 
-def _ping_remote(payload: dict) -> None:
-    """Anonymous ping. Caches ``latest_version`` from server response for upgrade notices."""
-    if os.getenv("HEFESTO_TELEMETRY", "").lower() in ("0", "false", "no", "off"):
-        return
+def _remote_opted_out() -> bool:
+    return os.getenv("HEFESTO_TELEMETRY", "").lower() in ("0", "false", "no", "off")
+
 
-    # First-run notice (once per machine)
+def _first_run_notice() -> None:
+    """Print the telemetry notice once per machine."""
     notice_file = Path.home() / ".hefesto" / ".telemetry_noticed"
     if not notice_file.exists():
         try:
@@ -324,6 +324,9 @@ def _ping_remote(payload: dict) -> None:
         except Exception:
             pass
 
+
+def _send_ping(payload: dict) -> None:
+    """POST ``payload`` and cache ``latest_version`` from the response. Never raises."""
     sid = _get_session_id()
     if sid:
         payload["sid"] = sid
@@ -331,6 +334,9 @@ def _ping_remote(payload: dict) -> None:
     payload["src"] = _get_install_source()
 
     try:
+        # Deferred: only the analyze ping needs the HTTP stack.
+        import urllib.request
+
         data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
         req = urllib.request.Request(
             TELEMETRY_ENDPOINT,
@@ -349,6 +355,37 @@ def _ping_remote(payload: dict) -> None:
         pass
 
 
+def _ping_remote_detached(payload: dict) -> None:
+    """Anonymous ping, with the HTTP round-trip in a detached child.
+
+    The CLI exits without waiting on the network (up to the 2s timeout). The
+    child still refreshes the ``latest_version`` cache, so the upgrade notice
+    picks it up on a later run. The first-run notice is printed here so it
+    reaches the user's terminal.
+    """
+    if _remote_opted_out():
+        return
+
+    _first_run_notice()
+    try:
+        import subprocess
+        import sys
+
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "hefesto.telemetry.client"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+        if proc.stdin is not None:
+            proc.stdin.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+            proc.stdin.close()
+    except Exception:
+        pass
+
+
 def _cache_latest_version(version: str) -> None:
     try:
         _LATEST_VERSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
@@ -363,7 +400,8 @@ def _cache_latest_version(version: str) -> None:
 def get_upgrade_notice(current_version: str) -> Optional[str]:
     """Return an upgrade notice string if a newer version is available, else None.
 
-    Reads from the local cache populated by ``_ping_remote``. Returns None
+    Reads from the local cache that the detached ping child fills in after
+    the CLI has exited, so a new release is noticed one run late. Returns None
     if cache is missing, stale (>24h), or current version is up to date.
     Never raises.
     """
@@ -393,3 +431,13 @@ def _is_newer(latest: str, current: str) -> bool:
         return l_parts > c_parts
     except (ValueError, AttributeError):
         return False
+
+
+if __name__ == "__main__":
+    # Entry point for _ping_remote_detached: payload arrives as JSON on stdin.
+    import sys
+
+    try:
+        _send_ping(json.loads(sys.stdin.read()))
+    except Exception:
+        pass
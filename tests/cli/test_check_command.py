@@ -0,0 +1,17 @@
+from click.testing import CliRunner
+
+from hefesto.cli.main import cli
+
+
+def test_check_reports_installed_and_missing_distributions(monkeypatch):
+    def fake_distributions(name=None, **kwargs):
+        return iter([]) if name == "bandit" else iter([object()])
+
+    monkeypatch.setattr("importlib.metadata.distributions", fake_distributions)
+
+    res = CliRunner().invoke(cli, ["check"])
+
+    assert res.exit_code == 0
+    assert "[OK] Click (CLI framework)" in res.output
+    assert "[MISSING] Bandit (security scanning)" in res.output
+    assert res.output.rstrip().endswith("Installation check complete!")
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from hefesto.analyzers.cloud.drift.aws_sg import AwsSgDriftDetector
+from hefesto.analyzers.cloud.graph.resolver import AwsSessionFactory
+from hefesto.core.drift_runner import DriftRunner
+
+
+def test_load_template_expands_short_form_intrinsics(tmp_path):
+    template = tmp_path / "template.yml"
+    template.write_text(
+        "Resources:\n"
+        "  SG:\n"
+        "    Type: AWS::EC2::SecurityGroup\n"
+        "    Properties:\n"
+        "      VpcId: !Ref Vpc\n"
+        "      GroupName: !Sub '${AWS::StackName}-sg'\n"
+        "      Owner: !GetAtt Role.Arn\n"
+        "      Tags: !If [IsProd, [a, !Ref B], !Ref AWS::NoValue]\n",
+        encoding="utf-8",
+    )
+
+    props = DriftRunner()._load_template(str(template))["Resources"]["SG"]["Properties"]
+
+    assert props["VpcId"] == {"Ref": "Vpc"}
+    assert props["GroupName"] == {"Fn::Sub": "${AWS::StackName}-sg"}
+    assert props["Owner"] == {"Fn::GetAtt": ["Role", "Arn"]}
+    assert props["Tags"] == {"Fn::If": ["IsProd", ["a", {"Ref": "B"}], {"Ref": "AWS::NoValue"}]}
+
+
+def test_run_reports_cache_hits_for_that_run_only(tmp_path, monkeypatch):
+    template = tmp_path / "template.yml"
+    template.write_text("Resources: {}\n", encoding="utf-8")
+    session = MagicMock()
+    session.client.return_value.describe_stack_resources.return_value = {
+        "StackResources": [{"LogicalResourceId": "WebSG", "PhysicalResourceId": "sg-1"}]
+    }
+    monkeypatch.setattr(AwsSessionFactory, "get_session", lambda region, credentials: session)
+    monkeypatch.setattr(AwsSgDriftDetector, "detect_drift", lambda self, template, context: [])
+
+    runner = DriftRunner()
+    summaries = [
+        runner.run(str(template), region="us-east-1", stack_name="app").summary for _ in range(3)
+    ]
+
+    # Only StackResolver finds anything; Tag/Name results are empty and not cached.
+    assert [(s["resolver_cache_hits"], s["resolver_cache_misses"]) for s in summaries] == [
+        (0, 3),
+        (1, 2),
+        (1, 2),
+    ]
@@ -1,6 +1,12 @@
 from unittest.mock import MagicMock
 
-from hefesto.analyzers.cloud.graph.resolver import ResourceResolver
+from hefesto.analyzers.cloud.graph.resolver import (
+    NameResolver,
+    ResolverCache,
+    ResolveResult,
+    ResourceResolver,
+    StackResolver,
+)
 
 
 def test_resolver_merges_with_precedence():
@@ -20,3 +26,59 @@ def test_resolver_merges_with_precedence():
     assert out.resource_map["X"] == "one"
     assert out.resource_map["Y"] == "two"
     assert "ResourceResolver: final resolved 2 logical IDs" in out.evidence[-1]
+
+
+def test_name_resolver_describes_all_candidates_in_one_call():
+    template = {
+        "Resources": {
+            "WebSG": {"Type": "AWS::EC2::SecurityGroup", "Properties": {"GroupName": "web"}},
+            "DbSG": {"Type": "AWS::EC2::SecurityGroup"},
+            "Dup": {"Type": "AWS::EC2::SecurityGroup", "Properties": {"GroupName": "dup"}},
+        }
+    }
+    session = MagicMock()
+    paginator = session.client.return_value.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {"GroupName": "web", "GroupId": "sg-web"},
+                {"GroupName": "DbSG", "GroupId": "sg-db"},
+                {"GroupName": "dup", "GroupId": "sg-1"},
+                {"GroupName": "dup", "GroupId": "sg-2"},
+            ]
+        }
+    ]
+
+    out = NameResolver().resolve(template=template, region="us-east-1", session=session)
+
+    paginator.paginate.assert_called_once_with(
+        Filters=[{"Name": "group-name", "Values": ["web", "DbSG", "dup"]}]
+    )
+    assert out.resource_map == {"WebSG": "sg-web", "DbSG": "sg-db"}
+    assert "matched 2/3" in out.evidence[-1]
+
+
+def test_resolver_cache_reuses_results_for_same_stack():
+    cache = ResolverCache()
+    session = MagicMock()
+    cfn = session.client.return_value
+    cfn.describe_stack_resources.return_value = {
+        "StackResources": [{"LogicalResourceId": "WebSG", "PhysicalResourceId": "sg-1"}]
+    }
+    resolver = ResourceResolver(strategies=[StackResolver()], cache=cache)
+    template_a = {"Metadata": {"HefestoStackName": "app"}, "Resources": {"A": {}}}
+    template_b = {"Metadata": {"HefestoStackName": "app"}, "Resources": {"B": {}}}
+
+    first = resolver.resolve(template=template_a, region="us-east-1", credentials=session)
+    second = resolver.resolve(template=template_b, region="us-east-1", credentials=session)
+
+    assert first.resource_map == second.resource_map == {"WebSG": "sg-1"}
+    assert cfn.describe_stack_resources.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_resolver_cache_skips_empty_results():
+    cache = ResolverCache()
+    cache.put(("StackResolver", "us-east-1", "app"), ResolveResult(resource_map={}, evidence=[]))
+
+    assert cache.get(("StackResolver", "us-east-1", "app")) is None
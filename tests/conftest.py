@@ -20,10 +20,14 @@ os.environ["GCP_PROJECT_ID"] = "hefesto-test-project"
 os.environ.setdefault("HEFESTO_EXPOSE_DOCS", "true")
 os.environ.setdefault("HEFESTO_WORKSPACE_ROOT", "/")
 
+# Keep analyze runs from spawning remote telemetry pings; tests that exercise
+# local telemetry opt in explicitly with HEFESTO_TELEMETRY=1.
+os.environ.setdefault("HEFESTO_TELEMETRY", "0")
+
 # Reset settings singleton so test env vars take effect
 import hefesto.config.settings as _cfg  # noqa: E402
 
-_cfg._settings = None
+_cfg.get_settings.cache_clear()
 
 
 @pytest.fixture
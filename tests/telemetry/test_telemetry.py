@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+import pytest
+
 from hefesto.telemetry.client import (
     TelemetryClient,
     _get_environment_flags,
@@ -311,3 +313,57 @@ def test_install_source_pypi():
     result = _get_install_source()
     # In test context, hefesto is imported from source (not site-packages)
     assert result in ("pypi", "editable", "unknown")
+
+
+def test_detect_command_names():
+    from hefesto.cli.main import _detect_command
+
+    assert _detect_command(["hefesto", "analyze", ".", "--severity", "HIGH"]) == "analyze"
+    assert _detect_command(["hefesto", "telemetry", "status"]) == "telemetry status"
+    assert _detect_command(["hefesto", "drift", "t.yml", "--region", "us-east-1"]) == "drift"
+    assert _detect_command(["hefesto", "analyze", "--help"]) == "help"
+    assert _detect_command(["hefesto", "--version"]) == "version"
+    # Unregistered tokens (typos, stray paths) are never recorded verbatim
+    assert _detect_command(["hefesto", "analyse", "."]) == "unknown"
+
+
+def test_ping_remote_detached_does_not_block(monkeypatch):
+    import subprocess
+
+    from hefesto.telemetry import client
+
+    spawned = {}
+
+    class FakePopen:
+        def __init__(self, args, **kwargs):
+            spawned["args"] = args
+            spawned["kwargs"] = kwargs
+            self.stdin = self
+
+        def write(self, data):
+            spawned["payload"] = data
+
+        def close(self):
+            spawned["closed"] = True
+
+    monkeypatch.setenv("HEFESTO_TELEMETRY", "1")
+    monkeypatch.setattr(client, "_first_run_notice", lambda: None)
+    monkeypatch.setattr(subprocess, "Popen", FakePopen)
+
+    client._ping_remote_detached({"event": "analyze"})
+
+    assert spawned["args"][1:] == ["-m", "hefesto.telemetry.client"]
+    assert spawned["kwargs"]["start_new_session"] is True
+    assert spawned["payload"] == b'{"event":"analyze"}'
+    assert spawned["closed"] is True
+
+
+def test_ping_remote_detached_respects_opt_out(monkeypatch):
+    import subprocess
+
+    from hefesto.telemetry import client
+
+    monkeypatch.setenv("HEFESTO_TELEMETRY", "0")
+    monkeypatch.setattr(subprocess, "Popen", lambda *a, **k: pytest.fail("spawned"))
+
+    client._ping_remote_detached({"event": "analyze"})
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import List
 
 from hefesto.analyzers.operational_truth import ImportsVsDepsAnalyzer
-from hefesto.core.analysis_models import AnalysisIssue, AnalysisIssueType
+from hefesto.core.analysis_models import AnalysisIssue, AnalysisIssueSeverity, AnalysisIssueType
 from hefesto.core.analyzer_engine import AnalyzerEngine
 
 
@@ -152,3 +152,91 @@ def test_analyze_files_without_project_root_warns(tmp_path: Path, caplog) -> Non
     assert any(
         "project_root" in rec.message and "CWD" in rec.message for rec in caplog.records
     ), caplog.text
+
+
+def test_analyze_files_skips_files_over_max_file_bytes(tmp_path: Path) -> None:
+    small = tmp_path / "small.py"
+    big = tmp_path / "big.py"
+    _write(small, "x = 1\n")
+    _write(big, "y = 2\n" * 100)
+
+    fake = _FakeFileAnalyzer()
+    engine = AnalyzerEngine(severity_threshold="LOW", max_file_bytes=64)
+    engine.register_analyzer(fake)
+    engine.analyze_files([str(small), str(big)], project_root=str(tmp_path))
+
+    assert fake.calls == [str(small.resolve())]
+    assert engine._build_meta()["parser_failures"] == [
+        {
+            "path": str(big.resolve()),
+            "language": "python",
+            "category": "file_too_large",
+            "exception": "_FileTooLargeError",
+            "bytes": 600,
+        }
+    ]
+
+
+def test_analyze_files_normalizes_crlf_like_text_mode(tmp_path: Path) -> None:
+    src = tmp_path / "crlf.py"
+    src.write_bytes(b"a = 1\r\nb = 2\rc = 3\n")
+
+    engine = AnalyzerEngine(severity_threshold="LOW")
+    engine.analyze_files([str(src)], project_root=str(tmp_path))
+
+    assert engine.source_cache[str(src.resolve())] == "a = 1\nb = 2\nc = 3\n"
+
+
+def test_analyze_files_without_cache_sources_keeps_cache_empty(tmp_path: Path) -> None:
+    src = tmp_path / "demo.py"
+    _write(src, "x = 1\n")
+
+    engine = AnalyzerEngine(severity_threshold="LOW", cache_sources=False)
+    report = engine.analyze_files([str(src)], project_root=str(tmp_path))
+
+    assert report.summary.files_analyzed == 1
+    assert engine.source_cache == {}
+
+
+def test_analyzer_below_threshold_max_severity_is_skipped(tmp_path: Path) -> None:
+    src = tmp_path / "demo.py"
+    _write(src, "x = 1\n")
+
+    low_only = _FakeFileAnalyzer()
+    low_only.max_severity = AnalysisIssueSeverity.MEDIUM
+    undeclared = _FakeFileAnalyzer()
+    engine = AnalyzerEngine(severity_threshold="HIGH")
+    engine.register_analyzer(low_only)
+    engine.register_analyzer(undeclared)
+    engine.analyze_files([str(src)], project_root=str(tmp_path))
+
+    assert low_only.calls == []
+    assert undeclared.calls == [str(src.resolve())]
+
+
+def test_analyze_path_result_sink_matches_materialized_report(tmp_path: Path) -> None:
+    _write(
+        tmp_path / "pyproject.toml",
+        '[project]\nname = "demo"\nversion = "0.1.0"\n' 'dependencies = ["pydantic>=2.0"]\n',
+    )
+    _write(tmp_path / "demo" / "__init__.py", "")
+    _write(tmp_path / "demo" / "main.py", "import click\n")
+
+    def _engine() -> AnalyzerEngine:
+        engine = AnalyzerEngine(severity_threshold="LOW")
+        engine.register_project_analyzer(ImportsVsDepsAnalyzer())
+        return engine
+
+    full = _engine().analyze_path(str(tmp_path))
+    streamed: list = []
+    report = _engine().analyze_path(str(tmp_path), result_sink=streamed.append)
+
+    def _shape(results) -> list:
+        return sorted(
+            (fr.file_path, sorted(i.issue_type.value for i in fr.issues)) for fr in results
+        )
+
+    assert report.file_results == []
+    assert _shape(streamed) == _shape(full.file_results)
+    assert report.summary.total_issues == full.summary.total_issues
+    assert report.summary.files_analyzed == full.summary.files_analyzed
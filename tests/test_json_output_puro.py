@@ -7,6 +7,7 @@ Verifies:
 """
 
 import json
+import os
 import subprocess
 import sys
 
@@ -163,3 +164,77 @@ def test_user_excludes_merge_with_defaults(tmp_path):
     assert any("z.py" in f for f in file_strs), "z.py should be found"
     assert not any(".venv" in f for f in file_strs), ".venv should still be excluded"
     assert not any("custom" in f for f in file_strs), "custom/ should be excluded by user pattern"
+
+
+def test_compiled_excludes_match_list_excludes(tmp_path):
+    """A matcher from compile_excludes() finds the same files as the raw list."""
+    from hefesto.core.analyzer_engine import AnalyzerEngine, compile_excludes
+
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "x.py").write_text("a = 1\n")
+    (tmp_path / "custom.d").mkdir()
+    (tmp_path / "custom.d" / "y.py").write_text("b = 2\n")
+    (tmp_path / "customXd").mkdir()
+    (tmp_path / "customXd" / "w.py").write_text("d = 4\n")
+    (tmp_path / "z.py").write_text("c = 3\n")
+
+    engine = AnalyzerEngine(severity_threshold="LOW", verbose=False)
+    from_list = engine._find_files(tmp_path, ["custom.d/"])
+    from_matcher = engine._find_files(tmp_path, compile_excludes(["custom.d/"]))
+
+    assert from_matcher == from_list
+    names = sorted(f.name for f in from_matcher)
+    # "." in a pattern is literal, not a regex wildcard
+    assert names == ["w.py", "z.py"]
+
+
+def test_find_files_single_walk_matches_registry_globs(tmp_path):
+    """One walk finds nested files by registry glob, once each, skipping symlinked dirs."""
+    from hefesto.core.analyzer_engine import AnalyzerEngine
+
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "mod.py").write_text("a = 1\n")
+    (tmp_path / "pkg" / "Dockerfile.prod").write_text("FROM python:3.12\n")
+    (tmp_path / "infra.tf.json").write_text("{}\n")
+    (tmp_path / "notes.txt").write_text("not code\n")
+    (tmp_path / "linked").symlink_to(tmp_path / "pkg", target_is_directory=True)
+
+    engine = AnalyzerEngine(severity_threshold="LOW", verbose=False)
+    files = engine._find_files(tmp_path, [])
+
+    rel = sorted(str(f.relative_to(tmp_path)) for f in files)
+    assert rel == ["infra.tf.json", "pkg/Dockerfile.prod", "pkg/sub/mod.py"]
+
+
+_PRINT_REPORT_SCRIPT = """
+from hefesto.cli.main import _print_report
+from hefesto.core.analysis_models import (
+    AnalysisIssue, AnalysisIssueSeverity, AnalysisIssueType,
+    AnalysisReport, AnalysisSummary, FileAnalysisResult,
+)
+
+issue = AnalysisIssue(
+    file_path="app.py", line=1, column=0,
+    issue_type=AnalysisIssueType.POOR_NAMING,
+    severity=AnalysisIssueSeverity.LOW,
+    message="Non-descriptive parameter name 'q'",
+    suggestion="Use a descriptive name: 'q' \u2192 'query'",
+)
+summary = AnalysisSummary(1, 1, 0, 0, 0, 1, 2, 0.1)
+report = AnalysisReport(summary, [FileAnalysisResult("app.py", [issue], 2, 1.0)])
+_print_report(report, "%s", None, True, None)
+"""
+
+
+@pytest.mark.parametrize("output", ["json", "html"])
+def test_report_prints_on_ascii_stdout(output):
+    """Reports with non-ASCII text must print when stdout is not UTF-8."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PRINT_REPORT_SCRIPT % output],
+        capture_output=True,
+        timeout=60,
+        env={**os.environ, "PYTHONIOENCODING": "ascii"},
+    )
+
+    assert result.returncode == 0, result.stderr.decode(errors="replace")
+    assert b"query" in result.stdout
@@ -0,0 +1,55 @@
+"""Tests for JSONReporter output encoding.
+
+Copyright (c) 2025 Narapa LLC, Miami, Florida
+"""
+
+from __future__ import annotations
+
+import json
+
+from hefesto.core.analysis_models import (
+    AnalysisIssue,
+    AnalysisIssueSeverity,
+    AnalysisIssueType,
+    AnalysisReport,
+    AnalysisSummary,
+    FileAnalysisResult,
+)
+from hefesto.reports import JSONReporter
+
+
+def _report(message: str) -> AnalysisReport:
+    issue = AnalysisIssue(
+        file_path="app.py",
+        line=3,
+        column=0,
+        issue_type=AnalysisIssueType.LONG_FUNCTION,
+        severity=AnalysisIssueSeverity.MEDIUM,
+        message=message,
+        confidence=1e-05,
+    )
+    return AnalysisReport(
+        summary=AnalysisSummary(
+            files_analyzed=1,
+            total_issues=1,
+            critical_issues=0,
+            high_issues=0,
+            medium_issues=1,
+            low_issues=0,
+            total_loc=10,
+            duration_seconds=float("nan"),
+        ),
+        file_results=[FileAnalysisResult("app.py", [issue], 10, 1.5)],
+    )
+
+
+def test_generate_matches_stdlib_json() -> None:
+    report = _report("Return type — use a → b instead")
+
+    output = JSONReporter().generate(report)
+
+    assert output == json.dumps(report.to_dict(), indent=2)
+    # Non-ASCII is escaped, so the report prints on any stdout encoding.
+    assert output.isascii()
+    assert "\\u2014" in output
+    assert '"duration_seconds": NaN' in output
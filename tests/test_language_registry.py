@@ -0,0 +1,53 @@
+"""Tests for LanguageRegistry filename precedence.
+
+Copyright (c) 2025 Narapa LLC, Miami, Florida
+"""
+
+from __future__ import annotations
+
+from fnmatch import translate
+from pathlib import Path
+
+import pytest
+
+from hefesto.core.languages.registry import LanguageRegistry, _alternation, _match_index
+from hefesto.core.languages.specs import Language
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("app.py", Language.PYTHON),
+        ("Dockerfile", Language.DOCKERFILE),
+        ("Dockerfile.sh", Language.DOCKERFILE),
+        ("main.tf.json", Language.TERRAFORM),
+        ("deploy.sh", Language.SHELL),
+        ("notes.txt", Language.UNKNOWN),
+    ],
+)
+def test_wildcards_take_precedence_over_extension(name: str, expected: Language) -> None:
+    assert LanguageRegistry().detect_language(Path(name)) == expected
+
+
+def test_alternation_maps_match_to_pattern_index() -> None:
+    # Multi-star globs translate to regexes with groups of their own.
+    globs = ["*.tf.json", "*_test*.py", "dockerfile.*"]
+    pattern = _alternation(translate(g) for g in globs)
+
+    assert _match_index(pattern, "main.tf.json") == 0
+    assert _match_index(pattern, "api_test_utils.py") == 1
+    assert _match_index(pattern, "dockerfile.dev") == 2
+    assert _match_index(pattern, "app.py") is None
+
+
+@pytest.mark.parametrize(
+    "first_line, expected",
+    [
+        ("#!/usr/bin/env bash", Language.SHELL),
+        ("#!/bin/sh -e", Language.SHELL),
+        ("#!/usr/bin/perl", Language.UNKNOWN),
+    ],
+)
+def test_shebang_detection(first_line: str, expected: Language) -> None:
+    content = f"{first_line}\necho hi\n"
+    assert LanguageRegistry().detect_language(Path("script"), content) == expected
@@ -1,5 +1,7 @@
 """Tests for Memory Budget Gate (EPIC 4)."""
 
+import tracemalloc
+
 from hefesto.core.memory_budget_gate import (
     DefaultRSSProvider,
     MemoryBudgetGate,
@@ -101,3 +103,48 @@ def test_env_threshold(monkeypatch):
     monkeypatch.setenv("HEFESTO_MEMORY_BUDGET_THRESHOLD_KB", "12345")
     gate = MemoryBudgetGate()
     assert gate.threshold_kb == 12345
+
+
+# ── tracemalloc peak ──────────────────────────────────────────────────
+
+
+def test_trace_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("HEFESTO_MEMORY_BUDGET_TRACE", raising=False)
+    gate = MemoryBudgetGate(threshold_kb=50_000, rss_provider=FakeRSSProvider(0, 0))
+
+    _, budget = gate.measure(lambda: None)
+
+    assert gate.trace is False
+    assert budget.traced_peak_kb is None
+    assert budget.to_dict()["traced_peak_kb"] is None
+    assert budget.prior_traced_peak_kb is None
+
+
+def test_trace_peak_checked_against_threshold(monkeypatch):
+    monkeypatch.setenv("HEFESTO_MEMORY_BUDGET_TRACE", "1")
+    provider = FakeRSSProvider(before_kb=100_000, after_kb=100_000)
+    gate = MemoryBudgetGate(threshold_kb=1_000, rss_provider=provider)
+
+    result, budget = gate.measure(lambda: len(bytearray(4 * 1024 * 1024)))
+
+    assert result == 4 * 1024 * 1024
+    assert budget.delta_kb == 0
+    assert budget.traced_peak_kb >= 4 * 1024
+    assert budget.passed is False
+    assert "traced peak" in budget.message
+
+
+def test_trace_reports_caller_peak_when_already_tracing():
+    tracemalloc.start()
+    try:
+        len(bytearray(8 * 1024 * 1024))  # caller's own peak, freed again
+        gate = MemoryBudgetGate(threshold_kb=50_000, rss_provider=FakeRSSProvider(0, 0), trace=True)
+
+        _, budget = gate.measure(lambda: None)
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert budget.prior_traced_peak_kb >= 8 * 1024
+    assert budget.traced_peak_kb < 1024
+    assert budget.passed is True
@@ -544,6 +544,11 @@ dependencies = ["click>=8.0.0"]
     assert "<html" in html.lower() or "<!doctype" in html.lower()
     assert "UNDECLARED_DEPENDENCY" in html or "requests" in html
 
+    out_path = tmp_path / "report.html"
+    with open(out_path, "w", encoding="utf-8") as f:
+        HTMLReporter().stream(report, f)
+    assert out_path.read_text(encoding="utf-8") == html
+
 
 def test_canary_engine_wires_project_analyzers(tmp_path: Path) -> None:
     """Real file containing a known violation per analyzer."""
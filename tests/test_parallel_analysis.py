@@ -0,0 +1,68 @@
+"""Tests for opt-in per-file process parallelism in AnalyzerEngine (``jobs``).
+
+Verifies that a pooled run produces the same report, ``source_cache`` and
+parser-failure list as a sequential run, and that small inputs or a single
+CPU stay on the sequential path.
+
+Copyright (c) 2025 Narapa LLC, Miami, Florida
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import hefesto.core.analyzer_engine as engine_mod
+from hefesto.analyzers.security import SecurityAnalyzer
+from hefesto.core.analyzer_engine import AnalyzerEngine
+
+
+def _make_engine(jobs: int) -> AnalyzerEngine:
+    engine = AnalyzerEngine(severity_threshold="LOW", quiet=True, jobs=jobs)
+    engine.register_analyzer(SecurityAnalyzer())
+    return engine
+
+
+def _issues(report) -> list:
+    return [
+        (fr.file_path, issue.line, issue.issue_type.value)
+        for fr in report.file_results
+        for issue in fr.issues
+    ]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    for i in range(6):
+        (tmp_path / f"mod_{i}.py").write_text(
+            f'API_KEY = "sk-live-{i:016d}"\n\ndef f():\n    return eval("1 + {i}")\n',
+            encoding="utf-8",
+        )
+    (tmp_path / "broken.ts").write_text("const x: number = 1;\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_parallel_matches_sequential(project: Path, monkeypatch) -> None:
+    monkeypatch.setattr(engine_mod.os, "cpu_count", lambda: 2)
+
+    seq = _make_engine(jobs=1)
+    par = _make_engine(jobs=2)
+    seq_report = seq.analyze_path(str(project))
+    par_report = par.analyze_path(str(project))
+
+    assert _issues(par_report) == _issues(seq_report)
+    assert par.source_cache == seq.source_cache
+    assert par._parser_failures == seq._parser_failures
+
+
+def test_single_cpu_stays_sequential(project: Path, monkeypatch) -> None:
+    monkeypatch.setattr(engine_mod.os, "cpu_count", lambda: 1)
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be started")
+
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", _no_pool)
+
+    report = _make_engine(jobs=4).analyze_path(str(project))
+    assert report.summary.files_analyzed >= 6
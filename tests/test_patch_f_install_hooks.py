@@ -170,3 +170,31 @@ class TestInstallHooks:
             assert result.returncode == 0
             assert "pre-push: already up to date." in result.stdout
             assert "pre-commit: already up to date." in result.stdout
+
+    def test_install_hooks_follows_gitdir_pointer_file(self, env_with_path):
+        """Test that a worktree-style .git file is followed to the shared hooks dir."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            common_dir = tmp / "main.git"
+            worktree_git = common_dir / "worktrees" / "feature"
+            worktree_git.mkdir(parents=True)
+            (worktree_git / "commondir").write_text("../..\n")
+
+            repo_root = tmp / "feature"
+            repo_root.mkdir()
+            (repo_root / ".git").write_text(f"gitdir: {worktree_git}\n")
+            self._create_hook_templates(repo_root)
+
+            result = subprocess.run(
+                [sys.executable, "-m", "hefesto.cli.main", "install-hooks"],
+                cwd=repo_root,
+                env=env_with_path,
+                capture_output=True,
+                text=True,
+            )
+
+            assert result.returncode == 0, f"Command failed: {result.stderr}"
+            for hook_name in ("pre-commit", "pre-push"):
+                dest = common_dir / "hooks" / hook_name
+                assert dest.exists(), f"{hook_name} should land in the common hooks dir"
+                assert bool(os.stat(dest).st_mode & stat.S_IEXEC)
@@ -0,0 +1,66 @@
+"""Tests for PythonParser node text.
+
+Node text is sliced lazily from the UTF-8 source using the byte offsets
+``ast`` reports, so it must stay correct on lines with non-ASCII characters
+and for nodes that carry no position info.
+
+Copyright (c) 2025 Narapa LLC, Miami, Florida
+"""
+
+from __future__ import annotations
+
+from hefesto.core.ast.generic_ast import GenericNode, NodeType
+from hefesto.core.parsers.python_parser import PythonParser
+
+
+def _texts(code: str) -> list:
+    tree = PythonParser().parse(code, "demo.py")
+    return [(n.metadata["python_node_type"], n.text) for n in tree.walk()]
+
+
+def test_node_text_spans_multiple_lines() -> None:
+    code = "def f(a):\n    return a + 1\n"
+    texts = dict(_texts(code))
+
+    assert texts["Module"] == ""
+    assert texts["FunctionDef"] == "def f(a):\n    return a + 1"
+    assert texts["Return"] == "return a + 1"
+
+
+def test_node_text_after_non_ascii_characters() -> None:
+    texts = _texts('s = "héllo"; x = "ñ" + y\n')
+
+    assert ("Constant", '"héllo"') in texts
+    assert ("BinOp", '"ñ" + y') in texts
+    assert ("Name", "y") in texts
+
+
+def test_explicit_text_is_kept() -> None:
+    node = GenericNode(
+        type=NodeType.UNKNOWN,
+        name=None,
+        line_start=1,
+        line_end=1,
+        column_start=0,
+        column_end=0,
+        text="raw",
+    )
+
+    assert node.text == "raw"
+
+
+def test_nodes_are_slotted() -> None:
+    tree = PythonParser().parse("x = 1\n", "demo.py")
+    node = tree.root.children[0]
+
+    assert not hasattr(node, "__dict__")
+    assert node.text == "x = 1"
+    node.text = "y = 2"
+    assert node.text == "y = 2"
+
+
+def test_syntax_error_spans_every_line() -> None:
+    tree = PythonParser().parse("def f(:\n    pass\n", "demo.py")
+
+    assert tree.root.line_end == 3
+    assert "error" in tree.root.metadata
@@ -75,3 +75,110 @@ def test_csharp_parses_with_cold_cache(isolated_pack_cache: Path) -> None:
         "C# AST has no children — parser loaded grammar but produced "
         "empty tree (degenerate case, not the LANG_MAP regression)"
     )
+
+
+class _FakeCursor:
+    """Minimal ``TreeCursor`` over stand-in nodes exposing ``children``."""
+
+    def __init__(self, root) -> None:
+        self._path = [(root, 0)]  # (node, index within its parent)
+
+    @property
+    def node(self):
+        return self._path[-1][0]
+
+    def goto_first_child(self) -> bool:
+        if not self.node.children:
+            return False
+        self._path.append((self.node.children[0], 0))
+        return True
+
+    def goto_next_sibling(self) -> bool:
+        if len(self._path) < 2:
+            return False
+        siblings = self._path[-2][0].children
+        index = self._path[-1][1] + 1
+        if index >= len(siblings):
+            return False
+        self._path[-1] = (siblings[index], index)
+        return True
+
+    def goto_parent(self) -> bool:
+        if len(self._path) < 2:
+            return False
+        self._path.pop()
+        return True
+
+
+def test_convert_slices_names_and_text_by_byte_offsets() -> None:
+    """Tree-sitter offsets index the UTF-8 bytes, not the ``str``; names and
+    text after a non-ASCII character must still line up."""
+    from types import SimpleNamespace
+
+    from hefesto.core.parsers.treesitter_parser import TreeSitterParser
+
+    code = 'const s = "ñ"; function foo() {}'
+    data = code.encode("utf-8")
+
+    def _node(type_, text, children=()):
+        start = data.index(text.encode("utf-8"))
+        return SimpleNamespace(
+            type=type_,
+            start_byte=start,
+            end_byte=start + len(text.encode("utf-8")),
+            start_point=(0, start),
+            end_point=(0, start + len(text.encode("utf-8"))),
+            children=list(children),
+        )
+
+    ident = _node("identifier", "foo")
+    func = _node("function_declaration", "function foo() {}", [ident])
+    root = _node("program", code, [func])
+
+    parser = object.__new__(TreeSitterParser)
+    parser.language = "javascript"
+    parser._node_types = {}
+    generic = parser._convert_tree(_FakeCursor(root), data)
+
+    func_node = generic.children[0]
+    assert func_node.name == "foo"
+    assert func_node.text == "function foo() {}"
+    assert generic.text == code
+
+
+def test_convert_tree_preserves_nesting_and_order() -> None:
+    from types import SimpleNamespace
+
+    from hefesto.core.parsers.treesitter_parser import TreeSitterParser
+
+    def _node(type_, children=()):
+        return SimpleNamespace(
+            type=type_,
+            start_byte=0,
+            end_byte=0,
+            start_point=(0, 0),
+            end_point=(0, 0),
+            children=list(children),
+        )
+
+    root = _node(
+        "program",
+        [
+            _node("a", [_node("a1", [_node("a1x")]), _node("a2")]),
+            _node("b"),
+            _node("c", [_node("c1")]),
+        ],
+    )
+
+    parser = object.__new__(TreeSitterParser)
+    parser.language = "javascript"
+    parser._node_types = {}
+    generic = parser._convert_tree(_FakeCursor(root), b"")
+
+    def _shape(n):
+        return (n.metadata["treesitter_type"], [_shape(c) for c in n.children])
+
+    assert _shape(generic) == (
+        "program",
+        [("a", [("a1", [("a1x", [])]), ("a2", [])]), ("b", []), ("c", [("c1", [])])],
+    )